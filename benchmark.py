@@ -0,0 +1,570 @@
+# benchmark.py
+"""
+End-to-end latency benchmark for WordPeek.
+Runs DictHelperApp headlessly (QT_QPA_PLATFORM=offscreen) against a local stub of
+dictionaryapi.dev, with fake clipboard / keystroke backends standing in for the
+real desktop, and reports p50/p95/p99 for each stage of a lookup:
+  hotkey -> selection   synthetic copy + clipboard read
+  selection -> paint    confirmation until the first (possibly partial) result is painted
+  selection -> result   confirmation + cache/network lookup, complete
+  result -> paint       building and first paint of the ResultWindow (results not streamed)
+Usage:
+ python benchmark.py [--runs 200] [--latency-ms 80] [--throughput-kib 0] [--payloads DIR] [--output bench.json]
+--payloads points at recorded API responses (<word>.json, one payload per file);
+without it synthetic payloads of realistic shape are served.
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import argparse
+import gc
+import json
+import random
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+# The benchmark must never install a real global keyboard hook or grab
+os.environ["WORDPEEK_HOTKEY_BACKEND"] = "keyboard"
+sys.modules.setdefault("keyboard", types.SimpleNamespace(add_hotkey=lambda *a, **k: None,
+                                                         remove_hotkey=lambda *a, **k: None))
+
+from PyQt5 import QtCore, QtWidgets
+
+import wordpeek
+
+# ---------- payloads ----------
+SYNTHETIC_WORDS = [
+    "serendipity", "ephemeral", "lucid", "quixotic", "ubiquitous", "laconic", "cogent",
+    "esoteric", "pragmatic", "tenacious", "verbose", "candid", "meticulous", "obscure",
+    "resilient", "set", "run", "take", "light", "point",
+]
+
+def synthetic_payload(word, meanings=3, definitions=6):
+    """A dictionaryapi.dev-shaped payload; common short words get much bigger entries."""
+    if len(word) <= 3:
+        meanings, definitions = 10, 150  # "set", "run": a few hundred KB, like the real API
+    elif len(word) <= 5:
+        meanings, definitions = 4, 60
+    parts = ["noun", "verb", "adjective", "adverb"]
+    return [{
+        "word": word,
+        "phonetic": f"/{word}/",
+        "phonetics": [{"text": f"/{word}/", "audio": ""}],
+        "meanings": [{
+            "partOfSpeech": parts[m % len(parts)],
+            "definitions": [{
+                "definition": f"Sense {d + 1} of {word} as a {parts[m % len(parts)]}, "
+                              "described at the length a typical dictionary entry would use.",
+                "example": f"An example sentence that uses {word} in context.",
+                "synonyms": [],
+                "antonyms": [],
+            } for d in range(definitions)],
+            "synonyms": [],
+            "antonyms": [],
+        } for m in range(meanings)],
+        "license": {"name": "CC BY-SA 3.0", "url": "https://creativecommons.org/licenses/by-sa/3.0"},
+        "sourceUrls": [f"https://en.wiktionary.org/wiki/{word}"],
+    }]
+
+def load_payloads(directory=None):
+    """Map of word -> encoded JSON body, from recorded files or synthetic data."""
+    payloads = {}
+    if directory:
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".json"):
+                with open(os.path.join(directory, name), "rb") as f:
+                    payloads[wordpeek.normalize_key(name[:-5])] = f.read()
+    else:
+        for word in SYNTHETIC_WORDS:
+            payloads[word] = json.dumps(synthetic_payload(word)).encode("utf-8")
+    return payloads
+
+# ---------- stub dictionary server ----------
+class StubDictionaryServer:
+    """
+    Serves /api/v2/entries/en/<word> from `payloads` after `latency` (+/- jitter) seconds,
+    at `throughput` bytes/second when set (0 = as fast as the socket allows).
+    """
+    def __init__(self, payloads, latency=0.08, jitter=0.02, throughput=0):
+        self.payloads = payloads
+        self.latency = latency
+        self.jitter = jitter
+        self.throughput = throughput
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+            disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+            def do_GET(self):
+                server.requests += 1
+                time.sleep(max(0.0, server.latency + random.uniform(-server.jitter, server.jitter)))
+                word = wordpeek.normalize_key(unquote(self.path.rsplit("/", 1)[-1]))
+                body = server.payloads.get(word)
+                status = 200
+                if body is None:
+                    status = 404
+                    body = b'{"title":"No Definitions Found"}'
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if not server.throughput:
+                    self.wfile.write(body)
+                    return
+                step = 8192
+                for i in range(0, len(body), step):
+                    self.wfile.write(body[i:i + step])
+                    self.wfile.flush()
+                    time.sleep(step / server.throughput)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api/v2/entries/en/"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+# ---------- fake desktop backends ----------
+class FakeClipboard:
+    """Stands in for pyperclip."""
+    def __init__(self):
+        self.text = ""
+        self.changes = 0
+
+    def paste(self):
+        return self.text
+
+    def copy(self, text):
+        self.text = text
+        self.changes += 1
+
+    def sequence(self):
+        return self.changes
+
+class FakeKeystrokes:
+    """Stands in for pyautogui: a synthetic copy puts the current 'selection' on the clipboard."""
+    def __init__(self, clipboard, copy_delay=0.005):
+        self.clipboard = clipboard
+        self.copy_delay = copy_delay
+        self.selection = ""
+
+    def hotkey(self, *keys):
+        def do_copy():
+            time.sleep(self.copy_delay)
+            self.clipboard.copy(self.selection)
+        threading.Thread(target=do_copy, daemon=True).start()
+
+    def keyDown(self, key):
+        pass
+
+    def keyUp(self, key):
+        pass
+
+    def press(self, key):
+        pass
+
+def install_fakes(copy_delay):
+    clipboard = FakeClipboard()
+    keys = FakeKeystrokes(clipboard, copy_delay)
+    wordpeek.pyperclip = clipboard
+    wordpeek.pyautogui = keys
+    # auto-confirm the "Lookup word?" dialog as soon as it is opened
+    wordpeek.LookupDialog.open = lambda self: QtCore.QTimer.singleShot(0, self.accept)
+    return clipboard, keys
+
+# ---------- measurement ----------
+def percentiles(samples):
+    if not samples:
+        return {"n": 0}
+    s = sorted(samples)
+    pick = lambda q: s[min(len(s) - 1, int(round(q * (len(s) - 1))))]
+    return {
+        "n": len(s),
+        "p50_ms": round(pick(0.50) * 1000, 2),
+        "p95_ms": round(pick(0.95) * 1000, 2),
+        "p99_ms": round(pick(0.99) * 1000, 2),
+        "mean_ms": round(sum(s) / len(s) * 1000, 2),
+    }
+
+class PaintProbe(QtCore.QObject):
+    """Application-wide event filter recording the first paint of each ResultWindow."""
+    def __init__(self):
+        super().__init__()
+        self.painted = {}  # window -> perf_counter of first paint
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            win = obj.window() if isinstance(obj, QtWidgets.QWidget) else None
+            if isinstance(win, wordpeek.ResultWindow) and win not in self.painted:
+                self.painted[win] = time.perf_counter()
+        return False
+
+def pump_until(app, predicate, timeout):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            return False
+        app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+    return True
+
+def run_benchmark(runs, latency, jitter, payload_dir, copy_delay, throughput=0, seed=1234):
+    random.seed(seed)
+    payloads = load_payloads(payload_dir)
+    server = StubDictionaryServer(payloads, latency, jitter, throughput).start()
+    cache_dir = tempfile.mkdtemp(prefix="wordpeek-bench-")
+    wordpeek.DICTIONARY_API = server.base_url
+    wordpeek.user_cache_dir = lambda: cache_dir
+    clipboard, keys = install_fakes(copy_delay)
+
+    app = wordpeek.DictHelperApp(sys.argv[:1])
+    app.clipboard_backend = clipboard
+    app.use_primary_selection = False
+    probe = PaintProbe()
+    app.installEventFilter(probe)
+
+    marks = {}
+    app.request_lookup.connect(lambda sel: marks.setdefault("selection", time.perf_counter()),
+                               QtCore.Qt.DirectConnection)
+    app.lookup_result.connect(lambda sel, res: marks.setdefault("result", time.perf_counter()),
+                              QtCore.Qt.DirectConnection)
+
+    stages = {"cold": {}, "warm": {}}
+    for group in stages.values():
+        for name in ("hotkey_to_selection", "selection_to_paint", "selection_to_result", "result_to_paint",
+                     "total"):
+            group[name] = []
+    seen = set()
+    words = sorted(payloads)
+    failures = 0
+
+    for _ in range(runs):
+        word = random.choice(words)
+        group = stages["warm" if word in seen else "cold"]
+        seen.add(word)
+        keys.selection = word
+        clipboard.copy("")
+        marks.clear()
+        probe.painted.clear()
+
+        t0 = time.perf_counter()
+        app.hotkey_dispatcher.press()
+        ok = pump_until(app, lambda: probe.painted and "result" in marks, timeout=15)
+        if not ok or "selection" not in marks:
+            failures += 1
+            continue
+        painted = min(probe.painted.values())
+        group["hotkey_to_selection"].append(marks["selection"] - t0)
+        group["selection_to_paint"].append(painted - marks["selection"])
+        group["selection_to_result"].append(marks["result"] - marks["selection"])
+        if painted >= marks["result"]:
+            group["result_to_paint"].append(painted - marks["result"])
+        group["total"].append(painted - t0)
+
+        if app.result_window is not None:
+            app.result_window.close()  # hides it; its tabs pile up to MAX_TABS, as in real use
+        app.processEvents()
+
+    report = {
+        "config": {
+            "runs": runs,
+            "latency_ms": latency * 1000,
+            "jitter_ms": jitter * 1000,
+            "throughput_kib_s": throughput / 1024,
+            "copy_delay_ms": copy_delay * 1000,
+            "payloads": payload_dir or "synthetic",
+            "words": len(words),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+        },
+        "failures": failures,
+        "server_requests": server.requests,
+        "stages": {g: {name: percentiles(v) for name, v in group.items()} for g, group in stages.items()},
+        "cache": app.lookup_service.cache.stats(),
+    }
+    app.lookup_engine.close()
+    app.lookup_service.close()
+    server.stop()
+    return report
+
+class NoFallbackClipboard:
+    """Fallback for the measured QtClipboard: a failed Qt read fails the run instead of timing pyperclip."""
+    name = "none"
+
+    def paste(self):
+        raise RuntimeError("Qt clipboard read failed")
+
+def capture_benchmark(reads=200):
+    """Per-read cost of each clipboard backend against the real platform clipboard."""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    gui = wordpeek.GuiInvoker()
+    backends = [wordpeek.PyperclipClipboard(), wordpeek.QtClipboard(gui, fallback=NoFallbackClipboard())]
+    results = {}
+    for backend in backends:
+        samples = []
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(reads):
+                    t0 = time.perf_counter()
+                    backend.paste()
+                    samples.append(time.perf_counter() - t0)
+            except Exception as e:
+                errors.append(e)
+
+        # read from a worker thread, as the hotkey worker does, while the GUI loop runs
+        t = threading.Thread(target=worker, daemon=True)
+        try:
+            backend.paste()
+        except Exception as e:
+            results[backend.name] = {"error": str(e)}
+            continue
+        t.start()
+        while t.is_alive():
+            app.processEvents(QtCore.QEventLoop.AllEvents, 5)
+        if errors:
+            results[backend.name] = {"error": f"{errors[0]} (after {len(samples)} reads)"}
+            continue
+        results[backend.name] = percentiles(samples)
+    return results
+
+def legacy_format_entries(data):
+    """The formatter as it was before the single-pass rewrite, kept as the baseline."""
+    out_lines = []
+    for entry in data:
+        if "word" in entry:
+            out_lines.append(f"Word: {entry.get('word')}")
+        if "phonetics" in entry and entry["phonetics"]:
+            ph = [p.get("text","") for p in entry["phonetics"] if p.get("text")]
+            if ph:
+                out_lines.append(f"Pronunciation: {', '.join(ph)}")
+        if "meanings" in entry:
+            for meaning in entry["meanings"]:
+                part = meaning.get("partOfSpeech","")
+                out_lines.append(f"\nPart of speech: {part}")
+                for i, defn in enumerate(meaning.get("definitions", []), start=1):
+                    d = defn.get("definition","")
+                    ex = defn.get("example","")
+                    out_lines.append(f"  {i}. {d}")
+                    if ex:
+                        out_lines.append(f"     e.g., {ex}")
+    return "\n".join(out_lines) if out_lines else None
+
+def best_time(fn, arg, repeat=7, number=20):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn(arg)
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
+
+def format_benchmark(payload_dir=None, largest=5):
+    """
+    Decode + format cost on the largest payloads: stdlib json vs json_loads, then the legacy
+    formatter against format_entries split into its stages (build the LookupResult, render
+    its text view) and both together.
+    """
+    payloads = load_payloads(payload_dir)
+    results = {}
+    for word, raw in sorted(payloads.items(), key=lambda kv: len(kv[1]), reverse=True)[:largest]:
+        data = json.loads(raw)
+        if wordpeek.format_entries(data) != legacy_format_entries(data):
+            raise AssertionError(f"format_entries output differs from the legacy formatter for {word!r}")
+        results[word] = {
+            "bytes": len(raw),
+            "decode_json_ms": round(best_time(json.loads, raw) * 1000, 3),
+            "decode_fast_ms": round(best_time(wordpeek.json_loads, raw) * 1000, 3),
+            "format_legacy_ms": round(best_time(legacy_format_entries, data) * 1000, 3),
+            "model_build_ms": round(best_time(wordpeek.LookupResult.from_api, data) * 1000, 3),
+            # _render_text bypasses the memo, so each call renders from scratch
+            "render_text_ms": round(best_time(lambda r: r._render_text(), wordpeek.LookupResult.from_api(data)) * 1000, 3),
+            "format_entries_ms": round(best_time(wordpeek.format_entries, data) * 1000, 3),
+        }
+    return {"orjson": wordpeek.orjson is not None, "payloads": results}
+
+class LegacyResultView(QtWidgets.QWidget):
+    """ResultWindow as it was before the paged list: the whole text in one QTextEdit."""
+    def __init__(self, text):
+        super().__init__()
+        self.resize(520, 420)
+        layout = QtWidgets.QVBoxLayout(self)
+        self.text_edit = QtWidgets.QTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setPlainText(text)
+        layout.addWidget(self.text_edit)
+        buttons = QtWidgets.QHBoxLayout()
+        buttons.addStretch(1)
+        buttons.addWidget(QtWidgets.QPushButton("Continue reading"))
+        buttons.addWidget(QtWidgets.QPushButton("Close app"))
+        layout.addLayout(buttons)
+
+class FirstPaint(QtCore.QObject):
+    """Event filter noting when the widget it is installed on first paints."""
+    def __init__(self):
+        super().__init__()
+        self.at = None
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint and self.at is None:
+            self.at = time.perf_counter()
+        return False
+
+def rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        import resource  # peak, not current, RSS: only a rough fallback off Linux
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+def _view_sample(mode, raw, windows):
+    """Build `windows` result views of one kind; per-view creation + first paint times and RSS."""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])
+    result = wordpeek.LookupResult.from_api(json.loads(raw))
+
+    def build():
+        if mode == "text":
+            w = LegacyResultView(result.text())
+            viewport = w.text_edit.viewport()
+        else:
+            w = wordpeek.ResultWindow()
+            viewport = w.add_result("benchmark", result).view.viewport()
+        probe = FirstPaint()
+        viewport.installEventFilter(probe)
+        w.show()
+        pump_until(app, lambda: probe.at is not None, timeout=10)
+        return w
+
+    build().close()  # one-time costs (fonts, style, first layout code paths) are not measured
+    app.processEvents()
+    gc.collect()
+    base = rss_bytes()
+    kept, samples = [], []
+    for _ in range(windows):
+        t0 = time.perf_counter()
+        kept.append(build())
+        samples.append(time.perf_counter() - t0)
+    app.processEvents()
+    gc.collect()
+    return {
+        "create_ms": percentiles(samples),
+        "rss_per_view_kib": round((rss_bytes() - base) / windows / 1024, 1),
+    }
+
+def view_benchmark(payload_dir=None, largest=3, windows=10):
+    """
+    Result view creation + first paint time and RSS on the largest payloads: the old
+    QTextEdit against the paged list view. Each sample runs in a fresh process so RSS
+    is not skewed by memory freed by the previous one.
+    """
+    payloads = load_payloads(payload_dir)
+    results = {}
+    ctx = get_context("spawn")
+    for word, raw in sorted(payloads.items(), key=lambda kv: len(kv[1]), reverse=True)[:largest]:
+        results[word] = {"bytes": len(raw)}
+        for mode in ("text", "list"):
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                results[word][mode] = pool.submit(_view_sample, mode, raw, windows).result()
+    return results
+
+def print_report(report):
+    print(f"WordPeek benchmark: {report['config']['runs']} runs, "
+          f"stub latency {report['config']['latency_ms']:.0f} ms, "
+          f"{report['failures']} failures, {report['server_requests']} API requests")
+    for group, stages in report["stages"].items():
+        print(f"\n[{group}]")
+        print(f"  {'stage':<22}{'n':>5}{'p50':>10}{'p95':>10}{'p99':>10}")
+        for name, st in stages.items():
+            if st["n"]:
+                print(f"  {name:<22}{st['n']:>5}{st['p50_ms']:>10.2f}{st['p95_ms']:>10.2f}{st['p99_ms']:>10.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WordPeek end-to-end latency benchmark")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="stub API latency")
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--throughput-kib", type=float, default=0.0,
+                        help="stub API bandwidth in KiB/s (0 = unlimited); large entries then arrive gradually")
+    parser.add_argument("--copy-delay-ms", type=float, default=5.0,
+                        help="how long the fake OS takes to put a copy on the clipboard")
+    parser.add_argument("--payloads", help="directory of recorded <word>.json API responses")
+    parser.add_argument("--output", help="write the machine-readable report (JSON) here")
+    parser.add_argument("--capture", action="store_true",
+                        help="only compare clipboard read cost of the pyperclip and Qt backends")
+    parser.add_argument("--format", action="store_true",
+                        help="only micro-benchmark JSON decoding and result formatting")
+    parser.add_argument("--view", action="store_true",
+                        help="only compare result view creation time and RSS (QTextEdit vs paged list)")
+    args = parser.parse_args(argv)
+
+    if args.view:
+        results = view_benchmark(args.payloads)
+        print(f"  {'word':<14}{'KiB':>8}{'view':>6}{'p50 ms':>9}{'p95 ms':>9}{'RSS KiB/view':>14}")
+        for word, r in results.items():
+            for mode in ("text", "list"):
+                st = r[mode]
+                print(f"  {word:<14}{r['bytes'] / 1024:>8.1f}{mode:>6}{st['create_ms']['p50_ms']:>9.2f}"
+                      f"{st['create_ms']['p95_ms']:>9.2f}{st['rss_per_view_kib']:>14.1f}")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"view": results}, f, indent=2)
+        return 0
+
+    if args.format:
+        results = format_benchmark(args.payloads)
+        print(f"JSON decoder: {'orjson' if results['orjson'] else 'json (orjson not installed)'}")
+        print(f"  {'word':<14}{'KiB':>8}{'json':>9}{'fast':>9}{'legacy fmt':>12}{'model':>9}{'render':>9}"
+              f"{'model+text':>12}  (ms)")
+        for word, r in results["payloads"].items():
+            print(f"  {word:<14}{r['bytes'] / 1024:>8.1f}{r['decode_json_ms']:>9.3f}{r['decode_fast_ms']:>9.3f}"
+                  f"{r['format_legacy_ms']:>12.3f}{r['model_build_ms']:>9.3f}{r['render_text_ms']:>9.3f}"
+                  f"{r['format_entries_ms']:>12.3f}")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"format": results}, f, indent=2)
+        return 0
+
+    if args.capture:
+        results = capture_benchmark()
+        for name, st in results.items():
+            if "error" in st:
+                print(f"{name:<10} unavailable: {st['error']}")
+            else:
+                print(f"{name:<10} p50 {st['p50_ms']:.3f} ms  p95 {st['p95_ms']:.3f} ms  p99 {st['p99_ms']:.3f} ms")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump({"capture": results}, f, indent=2)
+        return 0
+
+    report = run_benchmark(args.runs, args.latency_ms / 1000, args.jitter_ms / 1000,
+                           args.payloads, args.copy_delay_ms / 1000, args.throughput_kib * 1024)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["failures"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,23 +4,147 @@ WordPeek packaged-friendly script.
 Save as wordpeek.py before packaging with PyInstaller.
 Dependencies:
  pip install PyQt5 keyboard pyautogui pyperclip requests pillow
+ optional: pip install orjson  (faster decoding of large dictionary entries)
 Notes:
  - Global hotkeys may need accessibility/permission settings on macOS.
  - Build an .ico (Windows) or .icns (macOS) for the tray icon and pass via --add-data
 """
 
 import sys
-import threading
 import time
+
+_STARTUP_T0 = time.perf_counter()
+
+# --startup-profile: time every top-level import from here on (reported by report_startup_profile)
+_import_times = []  # (module name, seconds) for imports made at depth 0, nested ones included
+if "--startup-profile" in sys.argv:
+    import builtins
+
+    _real_import = builtins.__import__
+    _import_depth = [0]
+
+    def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if _import_depth[0] or level or name in sys.modules:
+            _import_depth[0] += 1
+            try:
+                return _real_import(name, globals, locals, fromlist, level)
+            finally:
+                _import_depth[0] -= 1
+        _import_depth[0] += 1
+        t0 = time.perf_counter()
+        try:
+            return _real_import(name, globals, locals, fromlist, level)
+        finally:
+            _import_depth[0] -= 1
+            _import_times.append((name, time.perf_counter() - t0))
+
+    builtins.__import__ = _timed_import
+
+import threading
 import platform
-import requests
-import pyperclip
-import pyautogui
 import os
+import re
+import json
+import codecs
+import random
+import mmap
+import struct
+import sqlite3
+import queue
+import select
+import ctypes
+import ctypes.util
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
-from PyQt5 import QtWidgets, QtGui, QtCore
+from PyQt5 import QtWidgets, QtGui, QtCore, QtNetwork
 from PyQt5.QtCore import pyqtSignal
 
+# Optional fast JSON (pip install orjson); large entries like "set" decode several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """Decode JSON from bytes or str, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(data):
+    """Compact JSON text (non-ASCII kept as-is), with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+# ---------- lazy imports ----------
+class LazyModule:
+    """
+    Stands in for a module until an attribute is first used, then imports it.
+    Keeps requests / pyperclip / pyautogui (and pyautogui's PIL, pyscreeze, pymsgbox)
+    off the startup path; they are only needed once the hotkey is pressed.
+    """
+    def __init__(self, name, loader):
+        self._name = name
+        self._loader = loader
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = self._loader()
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+# The imports live in functions so PyInstaller still finds and bundles them.
+def _import_requests():
+    import requests
+    import requests.adapters
+    return requests
+
+def _import_pyperclip():
+    import pyperclip
+    return pyperclip
+
+def _import_pyautogui():
+    import pyautogui
+    return pyautogui
+
+def _import_asyncio():
+    import asyncio
+    return asyncio
+
+requests = LazyModule("requests", _import_requests)
+pyperclip = LazyModule("pyperclip", _import_pyperclip)
+pyautogui = LazyModule("pyautogui", _import_pyautogui)
+asyncio = LazyModule("asyncio", _import_asyncio)
+DEFERRED_MODULES = (requests, pyperclip, pyautogui, asyncio)
+
+def warm_deferred_imports():
+    """Import the deferred modules (e.g. on an idle background thread after startup)."""
+    for module in DEFERRED_MODULES:
+        try:
+            module._load()
+        except Exception:
+            pass
+
+# Cold start budget checked by --startup-profile (process start -> tray ready)
+STARTUP_BUDGET_MS = 600
+
 # Hotkey config
 HOTKEY_WINDOWS_LINUX = "ctrl+shift+d"
 HOTKEY_MAC = "command+shift+d"
@@ -29,6 +153,43 @@ COPY_MODIFIER = "ctrl" if platform.system() != "Darwin" else "command"
 # Dictionary API (free example)
 DICTIONARY_API = "https://api.dictionaryapi.dev/api/v2/entries/en/"
 
+# On-disk lookup cache (raw API JSON per word), kept under the user's cache directory
+DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DISK_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Optional offline dictionary index (see build_offline_index); override with WORDPEEK_OFFLINE_INDEX
+OFFLINE_INDEX_NAME = "wordpeek.idx"
+
+# Hedged lookups: after HEDGE_DELAY seconds without an answer the next provider is queried too.
+# WORDPEEK_FALLBACK_API may list extra dictionaryapi.dev-compatible base URLs (comma separated).
+HEDGE_DELAY = 0.35
+
+# Lookups running at once (LookupEngine); the provider pool is sized from it
+LOOKUP_CONCURRENCY = 4
+FALLBACK_APIS = [u.strip() for u in os.environ.get("WORDPEEK_FALLBACK_API", "").split(",") if u.strip()]
+
+# Progressive results: API bodies are read and parsed in chunks of this many bytes
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Multi-word selections are looked up word by word (stopwords and repeats dropped):
+# at most BATCH_MAX_WORDS words, BATCH_CONCURRENCY of them in flight at once
+BATCH_MAX_WORDS = 12
+BATCH_CONCURRENCY = 3
+
+def user_cache_dir():
+    """Per-user cache directory for WordPeek (platform conventions, created on demand)."""
+    system = platform.system()
+    if system == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        path = os.path.join(base, "WordPeek", "Cache")
+    elif system == "Darwin":
+        path = os.path.expanduser("~/Library/Caches/WordPeek")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        path = os.path.join(base, "wordpeek")
+    os.makedirs(path, exist_ok=True)
+    return path
+
 # Helper for PyInstaller resource path
 def resource_path(relative_path):
     """Return path to resource, works for dev and for PyInstaller bundle."""
@@ -40,44 +201,351 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 # ---------- UI components ----------
-class LookupDialog(QtWidgets.QDialog):
-    def __init__(self, selection_text):
+class FirstPaintTimer:
+    """
+    Mixin for top-level widgets: measures show() -> first paint of each showing
+    and keeps it in last_first_paint_ms (None until the first show has painted).
+    first_paint_callback, if set, is called with that time from the paint itself.
+    """
+    last_first_paint_ms = None
+    first_paint_callback = None
+    _show_t0 = None
+
+    def setVisible(self, visible):
+        if visible and not self.isVisible():
+            self._show_t0 = time.perf_counter()
+        super().setVisible(visible)
+
+    def paintEvent(self, event):
+        if self._show_t0 is not None:
+            self.last_first_paint_ms = (time.perf_counter() - self._show_t0) * 1000
+            self._show_t0 = None
+            if self.first_paint_callback is not None:
+                self.first_paint_callback(self.last_first_paint_ms)
+        super().paintEvent(event)
+
+def prewarm_widget(widget):
+    """Do a hidden widget's first-show work (style polish, layout, native window) up front."""
+    widget.ensurePolished()
+    for child in widget.findChildren(QtWidgets.QWidget):
+        child.ensurePolished()
+    if widget.layout() is not None:
+        widget.layout().activate()
+    widget.winId()
+
+class LookupDialog(FirstPaintTimer, QtWidgets.QDialog):
+    """Confirmation prompt; built once and reused via set_selection()."""
+    def __init__(self, selection_text=""):
         super().__init__()
-        self.selection_text = selection_text
         self.setWindowTitle("Lookup word?")
         self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
         self.setFixedSize(420, 140)
 
         v = QtWidgets.QVBoxLayout()
-        label = QtWidgets.QLabel(f"Look up meaning of:\n\n\"{selection_text}\"")
-        label.setWordWrap(True)
-        v.addWidget(label)
+        self.label = QtWidgets.QLabel()
+        self.label.setWordWrap(True)
+        v.addWidget(self.label)
 
         btns = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Yes | QtWidgets.QDialogButtonBox.No)
         btns.accepted.connect(self.accept)
         btns.rejected.connect(self.reject)
         v.addWidget(btns)
         self.setLayout(v)
+        self.set_selection(selection_text)
+
+    def set_selection(self, selection_text):
+        self.selection_text = selection_text
+        self.label.setText(f"Look up meaning of:\n\n\"{selection_text}\"")
+
+class _Section:
+    """One part of speech in a DefinitionsModel: how many definitions are shown, and whether it is folded."""
+    __slots__ = ("meaning", "shown", "collapsed")
 
-class ResultWindow(QtWidgets.QWidget):
+    def __init__(self, meaning, shown, collapsed=False):
+        self.meaning = meaning
+        self.shown = shown
+        self.collapsed = collapsed
+
+class DefinitionsModel(QtCore.QAbstractListModel):
+    """
+    Flat list model of a LookupResult: a row per entry header, part of speech and definition.
+    Long parts of speech are paged (PAGE_SIZE definitions, then a "show more" row) and can
+    be collapsed; parts of speech past the first INITIAL_ROWS definitions start collapsed.
+    So the view never holds rows for definitions nobody has asked to see.
+    A BatchResult shows each word in turn with only its first few definitions open.
+    A plain string result (e.g. an error message) is shown as a single row.
     """
-    Shows the lookup result and provides two actions:
-      - Continue reading: close this window and keep the app running.
+    HEADER, POS, DEFINITION, MORE, TEXT = range(5)
+    KindRole = QtCore.Qt.UserRole + 1
+    PAGE_SIZE = 20
+    INITIAL_ROWS = 40
+    BATCH_ROWS_PER_WORD = 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.result = None  # the LookupResult shown (None for a plain string)
+        self._rows = []  # (kind, entry/_Section/str, definition index)
+        self._initial_rows = 0  # definition rows shown expanded so far
+
+    def set_result(self, result):
+        self.beginResetModel()
+        self.result = None
+        self._rows = []
+        self._initial_rows = 0
+        if isinstance(result, LookupResult):
+            self.result = result
+            self._add_result_rows(result, self.PAGE_SIZE, self.INITIAL_ROWS)
+        elif isinstance(result, BatchResult):
+            self.result = result
+            for word, item in result.items:
+                if isinstance(item, LookupResult):
+                    self._initial_rows = 0
+                    self._add_result_rows(item, self.BATCH_ROWS_PER_WORD, self.BATCH_ROWS_PER_WORD)
+                else:
+                    self._rows.append((self.TEXT, f"{word}: {item or 'no such word'}", 0))
+        elif result:
+            self._rows.append((self.TEXT, str(result), 0))
+        self.endResetModel()
+
+    def _add_result_rows(self, result, page, budget):
+        for entry in result.entries:
+            self._rows.extend(self._entry_rows(entry))
+            for meaning in entry.meanings:
+                self._rows.extend(self._section_rows(self._new_section(meaning, page, budget)))
+
+    def append(self, pieces):
+        """Add ("entry", Entry) / ("meaning", Meaning) pieces of a result that is still streaming in."""
+        if self.result is None:
+            self.result = LookupResult([])
+        entries = self.result.entries
+        new_rows = []
+        for kind, piece in pieces:
+            if kind == "entry":
+                entry = Entry(piece.word, piece.phonetics, [])
+                entries.append(entry)
+                new_rows.extend(self._entry_rows(entry))
+            elif entries:
+                entries[-1].meanings.append(piece)
+                new_rows.extend(self._section_rows(self._new_section(piece)))
+        if new_rows:
+            first = len(self._rows)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(new_rows) - 1)
+            self._rows.extend(new_rows)
+            self.endInsertRows()
+
+    def _new_section(self, meaning, page=None, budget=None):
+        page = page or self.PAGE_SIZE
+        section = _Section(meaning, page, collapsed=self._initial_rows >= (budget or self.INITIAL_ROWS))
+        if not section.collapsed:
+            self._initial_rows += min(page, len(meaning.definitions))
+        return section
+
+    def _entry_rows(self, entry):
+        return [(self.HEADER, entry, 0)] if entry.word is not None or entry.phonetics else []
+
+    def _section_rows(self, section):
+        rows = [(self.POS, section, 0)]
+        if not section.collapsed:
+            count = len(section.meaning.definitions)
+            shown = min(section.shown, count)
+            rows.extend((self.DEFINITION, section, i) for i in range(shown))
+            if shown < count:
+                rows.append((self.MORE, section, 0))
+        return rows
+
+    def activate(self, row):
+        """Fold/unfold a part of speech, or show the next page of its definitions."""
+        if not 0 <= row < len(self._rows):
+            return
+        kind, section, _ = self._rows[row]
+        if kind == self.POS:
+            section.collapsed = not section.collapsed
+        elif kind == self.MORE:
+            section.shown += self.PAGE_SIZE
+        else:
+            return
+        start = row
+        while self._rows[start][0] != self.POS or self._rows[start][1] is not section:
+            start -= 1
+        end = start + 1
+        while end < len(self._rows) and self._rows[end][1] is section:
+            end += 1
+        self._replace_rows(start, end, self._section_rows(section))
+
+    def _replace_rows(self, start, end, new_rows):
+        # the part of speech row itself stays; only what follows it changes
+        if end - start > 1:
+            self.beginRemoveRows(QtCore.QModelIndex(), start + 1, end - 1)
+            del self._rows[start + 1:end]
+            self.endRemoveRows()
+        self._rows[start] = new_rows[0]
+        idx = self.index(start)
+        self.dataChanged.emit(idx, idx)
+        if len(new_rows) > 1:
+            self.beginInsertRows(QtCore.QModelIndex(), start + 1, start + len(new_rows) - 1)
+            self._rows[start + 1:start + 1] = new_rows[1:]
+            self.endInsertRows()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        kind, item, i = self._rows[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return self._display(kind, item, i)
+        if role == self.KindRole:
+            return kind
+        if role == QtCore.Qt.FontRole and kind in (self.HEADER, self.POS):
+            font = QtGui.QFont()
+            font.setBold(True)
+            if kind == self.HEADER:
+                font.setPointSizeF(font.pointSizeF() * 1.25)
+            return font
+        if role == QtCore.Qt.ForegroundRole and kind == self.MORE:
+            return QtWidgets.QApplication.palette().link()
+        return None
+
+    def _display(self, kind, item, i):
+        if kind == self.DEFINITION:
+            d = item.meaning.definitions[i]
+            return f"{i + 1}. {d.text}\n     e.g., {d.example}" if d.example else f"{i + 1}. {d.text}"
+        if kind == self.POS:
+            arrow = "\u25b8" if item.collapsed else "\u25be"
+            return f"{arrow} {item.meaning.part_of_speech} ({len(item.meaning.definitions)})"
+        if kind == self.MORE:
+            left = len(item.meaning.definitions) - item.shown
+            return f"Show {min(left, self.PAGE_SIZE)} more of {left}\u2026"
+        if kind == self.HEADER:
+            parts = [item.word] if item.word is not None else []
+            if item.phonetics:
+                parts.append(", ".join(item.phonetics))
+            return "   ".join(parts)
+        return item
+
+class DefinitionDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Word-wrapped rows whose height follows the view's width. QListView re-measures every
+    row whenever rows are inserted, so heights are cached per (kind, text) until the width changes.
+    """
+    PADDING = 4
+    MAX_CACHED = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._width = None
+        self._heights = {}
+
+    def sizeHint(self, option, index):
+        view = option.widget
+        width = view.viewport().width() if view is not None else 480
+        if width != self._width:
+            self._width = width
+            self._heights.clear()
+        key = (index.data(DefinitionsModel.KindRole), index.data())
+        height = self._heights.get(key)
+        if height is None:
+            opt = QtWidgets.QStyleOptionViewItem(option)
+            self.initStyleOption(opt, index)
+            inner = max(50, width - 4 * self.PADDING)
+            rect = QtGui.QFontMetrics(opt.font).boundingRect(
+                QtCore.QRect(0, 0, inner, 1 << 20), QtCore.Qt.TextWordWrap, opt.text)
+            height = rect.height() + 2 * self.PADDING
+            if len(self._heights) >= self.MAX_CACHED:
+                self._heights.clear()
+            self._heights[key] = height
+        return QtCore.QSize(width, height)
+
+class ResultPage(QtWidgets.QWidget):
+    """One result tab: a paged QListView (DefinitionsModel) that lays out only visible rows."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.word = ""
+        self.model = DefinitionsModel(self)
+        self.view = QtWidgets.QListView()
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(DefinitionDelegate(self.view))
+        self.view.setWordWrap(True)
+        self.view.setUniformItemSizes(False)
+        self.view.setResizeMode(QtWidgets.QListView.Adjust)
+        self.view.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.view.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.view.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.view.clicked.connect(lambda index: self.model.activate(index.row()))
+        copy_action = QtWidgets.QAction(self.view)
+        copy_action.setShortcut(QtGui.QKeySequence.Copy)
+        copy_action.triggered.connect(self._copy_selection)
+        self.view.addAction(copy_action)
+
+        layout = QtWidgets.QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.view)
+        self.setLayout(layout)
+
+    @property
+    def result(self):
+        return self.model.result
+
+    def set_result(self, result):
+        """Show `result`: a LookupResult, a BatchResult, or a plain message string."""
+        self.model.set_result(result)
+        self.view.scrollToTop()
+
+    def append_pieces(self, pieces):
+        """Append parsed pieces of a streaming result without moving the user's scroll position."""
+        self.model.append(pieces)
+
+    def clear(self):
+        """Drop the current result so the page holds no memory for it."""
+        self.word = ""
+        self.model.set_result(None)
+
+    def approx_size(self):
+        result = self.model.result
+        return result.approx_size() if result is not None else 0
+
+    def _copy_selection(self):
+        rows = sorted(index.row() for index in self.view.selectionModel().selectedIndexes())
+        text = "\n".join(self.model.index(row).data() for row in rows)
+        if text:
+            QtWidgets.QApplication.clipboard().setText(text)
+
+class ResultWindow(FirstPaintTimer, QtWidgets.QWidget):
+    """
+    The one result window: every lookup opens in a tab (a ResultPage). Two actions:
+      - Continue reading: hide this window and keep the app running.
       - Close app: quit the entire application.
+    At most `max_tabs` tabs holding about `max_bytes` of results are kept; the oldest
+    are evicted first. Hiding or closing the window keeps its tabs for the next showing.
+    `page_removed` is emitted for each page that leaves the window.
     """
-    def __init__(self, title, text, app_ref=None):
+    MAX_TABS = 8
+    MAX_BYTES = 8 * 1024 * 1024
+    MAX_SPARE_PAGES = 1
+
+    page_removed = pyqtSignal(object)
+
+    def __init__(self, app_ref=None, max_tabs=None, max_bytes=None):
         super().__init__()
         self.app_ref = app_ref
-        self.setWindowTitle(title)
+        self.max_tabs = max_tabs or self.MAX_TABS
+        self.max_bytes = max_bytes or self.MAX_BYTES
+        self.evictions = 0
         self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
+        self.setWindowTitle("WordPeek")
         self.resize(520, 420)
 
         main_layout = QtWidgets.QVBoxLayout()
 
-        txt = QtWidgets.QTextEdit()
-        txt.setReadOnly(True)
-        txt.setPlainText(text)
-        main_layout.addWidget(txt)
+        self.tabs = QtWidgets.QTabWidget()
+        self.tabs.setTabsClosable(True)
+        self.tabs.setDocumentMode(True)
+        self.tabs.setElideMode(QtCore.Qt.ElideRight)
+        self.tabs.tabCloseRequested.connect(self._on_tab_close_requested)
+        self.tabs.currentChanged.connect(self._update_title)
+        main_layout.addWidget(self.tabs)
+        self._spare_pages = [ResultPage()]  # built ahead so the first lookup only fills it
 
         # Buttons area
         btn_layout = QtWidgets.QHBoxLayout()
@@ -96,9 +564,57 @@ class ResultWindow(QtWidgets.QWidget):
         self.continue_btn.clicked.connect(self._on_continue)
         self.close_app_btn.clicked.connect(self._on_close_app)
 
+    def add_result(self, word, result):
+        """Open `result` (see ResultPage.set_result) in a new current tab; returns its page."""
+        page = self._spare_pages.pop() if self._spare_pages else ResultPage()
+        page.word = word
+        page.set_result(result)
+        index = self.tabs.addTab(page, word)
+        self.tabs.setTabToolTip(index, word)
+        self.tabs.setCurrentIndex(index)
+        self.enforce_limits()
+        return page
+
+    def pages(self):
+        return [self.tabs.widget(i) for i in range(self.tabs.count())]
+
+    def memory_bytes(self):
+        """Approximate bytes of results held by the open tabs."""
+        return sum(page.approx_size() for page in self.pages())
+
+    def enforce_limits(self):
+        """Close the oldest tabs while over max_tabs or max_bytes; the current tab always stays."""
+        while self.tabs.count() > 1:
+            if self.tabs.count() <= self.max_tabs and self.memory_bytes() <= self.max_bytes:
+                break
+            self.close_tab(1 if self.tabs.currentIndex() == 0 else 0)
+            self.evictions += 1
+
+    def close_tab(self, index):
+        """Remove a tab and release its result; the page is kept as a spare or deleted."""
+        page = self.tabs.widget(index)
+        if page is None:
+            return
+        self.tabs.removeTab(index)
+        page.clear()
+        self.page_removed.emit(page)
+        if len(self._spare_pages) < self.MAX_SPARE_PAGES:
+            self._spare_pages.append(page)
+        else:
+            page.deleteLater()
+
+    def _on_tab_close_requested(self, index):
+        self.close_tab(index)
+        if not self.tabs.count():
+            self.close()
+
+    def _update_title(self, index):
+        page = self.tabs.widget(index)
+        self.setWindowTitle(f"Meaning: {page.word}" if page is not None else "WordPeek")
+
     def _on_continue(self):
-        """Close this result window only; the application keeps running."""
-        self.close()
+        """Hide the result window, tabs and all; the application keeps running."""
+        self.hide()
 
     def _on_close_app(self):
         """Quit the entire application immediately."""
@@ -106,57 +622,1866 @@ class ResultWindow(QtWidgets.QWidget):
         QtWidgets.QApplication.instance().quit()
 
 # ---------- networking / API ----------
-def lookup_word_api(word):
+class LookupClient:
     """
-    Query the dictionary API; return a nicely formatted string or None if not found.
+    Long-lived HTTP client for the dictionary API.
+    Owns a requests.Session with a keep-alive connection pool so repeated lookups
+    reuse the same TCP/TLS connection instead of paying DNS + handshakes each time.
+    A single instance is safe to share between lookup threads.
     """
-    url = DICTIONARY_API + requests.utils.quote(word)
+    def __init__(self, base_url=None, timeout=6, pool_size=4):
+        self.base_url = base_url or DICTIONARY_API
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._session = None  # created on first request so startup never imports requests
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    session.headers.update({"Accept": "application/json", "Connection": "keep-alive"})
+                    self._session = session
+        return self._session
+
+    def get(self, word, timeout=None, stream=False):
+        """GET the API entry for `word`; returns the requests.Response (body unread if `stream`)."""
+        url = self.base_url + requests.utils.quote(word)
+        return self.session.get(url, timeout=timeout or self.timeout, stream=stream)
+
+    def close(self):
+        if self._session is None:
+            return
+        try:
+            self._session.close()
+        except Exception:
+            pass
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+def default_client():
+    """Return the process-wide LookupClient, creating it on first use."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = LookupClient()
+        return _default_client
+
+class DictionaryAPIError(Exception):
+    """
+    Raised when the dictionary API could not give a usable answer (never cached).
+    `transient` is True for failures worth retrying: network errors, timeouts, 5xx and 429.
+    """
+    def __init__(self, message, status=None, transient=False):
+        super().__init__(message)
+        self.status = status
+        self.transient = transient
+
+class EntryStreamParser:
+    """
+    Incremental parser for the API's top-level JSON array of entries.
+    feed() it the body bytes as they arrive; it returns the events completed so far:
+      ("header", entry)    an entry's fields before "meanings" (word, phonetics) are known
+      ("meaning", meaning) one element of that entry's "meanings" array
+    Only those two levels are parsed incrementally; every other value is decoded whole,
+    objects and arrays with orjson when it is installed.
+    close() returns the last events; `entries` then holds the fully decoded list.
+    """
+    _NEED = object()  # yielded by the parsing generator when it has run out of input
+    _WS = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self):
+        self.entries = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._done = False
+        self._gen = self._parse()
+
+    def feed(self, data):
+        # drop what has been consumed so the buffer only holds the value being parsed
+        self._buf = self._buf[self._pos:] + self._decoder.decode(data)
+        self._pos = 0
+        return self._drain()
+
+    def close(self):
+        self._buf = self._buf[self._pos:] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        events = self._drain()
+        if not self._done:
+            raise ValueError("truncated JSON document")
+        return events
+
+    def _drain(self):
+        events = []
+        for event in self._gen:
+            if event is self._NEED:
+                break
+            events.append(event)
+        return events
+
+    def _peek(self):
+        while True:
+            self._pos = self._WS.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                raise ValueError("unexpected end of JSON document")
+            yield self._NEED
+
+    def _expect(self, chars):
+        c = yield from self._peek()
+        if c not in chars:
+            raise ValueError(f"expected one of {chars!r} at char {self._pos}, got {c!r}")
+        self._pos += 1
+        return c
+
+    def _value(self):
+        c = yield from self._peek()
+        decode = self._decode_container if orjson is not None and c in "[{" else self._json.raw_decode
+        while True:
+            try:
+                value, end = decode(self._buf, self._pos)
+            except ValueError:
+                if self._eof:
+                    raise
+                yield self._NEED
+                continue
+            if end == len(self._buf) and isinstance(value, (int, float)) and not self._eof:
+                yield self._NEED  # the number may go on in the next chunk
+                continue
+            self._pos = end
+            return value
+
+    @staticmethod
+    def _decode_container(buf, pos):
+        """
+        raw_decode for an object or array (a whole meaning, say) with orjson, which has no
+        raw_decode of its own: the error for whatever follows the value says where it ends,
+        and that slice is decoded again. Raises ValueError while the value is incomplete.
+        """
+        text = buf[pos:]
+        try:
+            return orjson.loads(text), len(buf)
+        except orjson.JSONDecodeError as e:
+            if e.pos >= len(text.rstrip()):
+                raise  # ran out of input
+            return orjson.loads(text[:e.pos]), pos + e.pos
+
+    def _parse(self):
+        yield from self._expect("[")
+        if (yield from self._peek()) == "]":
+            self._pos += 1
+        else:
+            while True:
+                yield from self._expect("{")
+                entry = {}
+                self.entries.append(entry)
+                announced = False
+                if (yield from self._peek()) == "}":
+                    self._pos += 1
+                else:
+                    while True:
+                        key = yield from self._value()
+                        yield from self._expect(":")
+                        if key == "meanings" and (yield from self._peek()) == "[":
+                            self._pos += 1
+                            if not announced:
+                                announced = True
+                                yield ("header", entry)
+                            meanings = entry[key] = []
+                            if (yield from self._peek()) == "]":
+                                self._pos += 1
+                            else:
+                                while True:
+                                    meaning = yield from self._value()
+                                    meanings.append(meaning)
+                                    yield ("meaning", meaning)
+                                    if (yield from self._expect(",]")) == "]":
+                                        break
+                        else:
+                            entry[key] = yield from self._value()
+                        if (yield from self._expect(",}")) == "}":
+                            break
+                if not announced:
+                    yield ("header", entry)
+                if (yield from self._expect(",]")) == "]":
+                    break
+        self._done = True
+
+def read_entries_stream(response, on_event, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Read a streamed 200 response with EntryStreamParser, calling on_event(index, kind, raw)
+    for each parser event as it completes. Returns the decoded list of entries.
+    """
+    parser = EntryStreamParser()
+    index = 0
     try:
-        r = requests.get(url, timeout=6)
+        for chunk in response.iter_content(chunk_size):
+            for kind, raw in parser.feed(chunk):
+                on_event(index, kind, raw)
+                index += 1
+        for kind, raw in parser.close():
+            on_event(index, kind, raw)
+            index += 1
+        return parser.entries
+    except requests.RequestException as e:
+        raise DictionaryAPIError(f"Error contacting dictionary API: {e}", transient=True)
+    except ValueError as e:
+        raise DictionaryAPIError(f"Error parsing API response: {e}", status=200)
+    finally:
+        response.close()
+
+def fetch_entries(word, client=None, timeout=None, on_event=None):
+    """
+    Fetch the raw API JSON for `word`.
+    Returns the decoded list of entries, or None if the word does not exist (404).
+    With `on_event` the body is streamed and parsed as it arrives (see read_entries_stream).
+    Raises DictionaryAPIError for network errors and unexpected responses.
+    """
+    client = client or default_client()
+    stream = on_event is not None
+    try:
+        r = client.get(word, timeout=timeout, stream=stream)
+        if stream and r.status_code != 200:
+            r.content  # small error body: read it so the connection goes back to the pool
     except Exception as e:
-        return f"Error contacting dictionary API: {e}"
+        raise DictionaryAPIError(f"Error contacting dictionary API: {e}", transient=True)
 
     if r.status_code == 200:
+        if stream:
+            return read_entries_stream(r, on_event)
         try:
-            data = r.json()
-            out_lines = []
-            for entry in data:
-                if "word" in entry:
-                    out_lines.append(f"Word: {entry.get('word')}")
-                if "phonetics" in entry and entry["phonetics"]:
-                    ph = [p.get("text","") for p in entry["phonetics"] if p.get("text")]
-                    if ph:
-                        out_lines.append(f"Pronunciation: {', '.join(ph)}")
-                if "meanings" in entry:
-                    for meaning in entry["meanings"]:
-                        part = meaning.get("partOfSpeech","")
-                        out_lines.append(f"\nPart of speech: {part}")
-                        for i, defn in enumerate(meaning.get("definitions", []), start=1):
-                            d = defn.get("definition","")
-                            ex = defn.get("example","")
-                            out_lines.append(f"  {i}. {d}")
-                            if ex:
-                                out_lines.append(f"     e.g., {ex}")
-            return "\n".join(out_lines) if out_lines else None
+            return json_loads(r.content)
         except Exception as e:
-            return f"Error parsing API response: {e}"
+            raise DictionaryAPIError(f"Error parsing API response: {e}", status=200)
     elif r.status_code == 404:
         return None
     else:
-        return f"Unexpected API response: {r.status_code}"
+        transient = r.status_code >= 500 or r.status_code == 429
+        raise DictionaryAPIError(f"Unexpected API response: {r.status_code}",
+                                 status=r.status_code, transient=transient)
+
+# ---------- resilience ----------
+class CircuitOpenError(DictionaryAPIError):
+    """Raised without touching the network while a provider's circuit breaker is open."""
+
+class CircuitBreaker:
+    """
+    Fails fast while an endpoint is unhealthy.
+    closed    -> normal; `failure_threshold` consecutive failures open the circuit.
+    open      -> every call is refused until `reset_timeout` seconds have passed.
+    half-open -> a single trial call is let through; success closes, failure re-opens.
+    `on_state_change(state)` is called (from the calling thread) on every transition.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=4, reset_timeout=30.0, on_state_change=None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def _set_state(self, state):
+        # called with the lock held; returns the callback to run after releasing it
+        if state == self.state:
+            return None
+        self.state = state
+        if self.on_state_change is None:
+            return None
+        return lambda: self.on_state_change(state)
+
+    def allow(self):
+        """True if a call may go out now."""
+        notify = None
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                notify = self._set_state(self.HALF_OPEN)
+            if self.state == self.CLOSED:
+                allowed = True
+            elif self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                allowed = True
+            else:
+                allowed = False
+        if notify:
+            notify()
+        return allowed
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._trial_running = False
+            notify = self._set_state(self.CLOSED)
+        if notify:
+            notify()
+
+    def record_failure(self):
+        notify = None
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                notify = self._set_state(self.OPEN)
+        if notify:
+            notify()
+
+class AdaptiveTimeout:
+    """
+    Request timeout derived from observed latencies: `factor` x the `percentile`
+    latency of the last `window` calls, clamped to [minimum, maximum].
+    Until `min_samples` have been seen the conservative `maximum` is used.
+    """
+    def __init__(self, minimum=1.5, maximum=6.0, percentile=0.95, factor=2.0, window=100, min_samples=10):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.percentile = percentile
+        self.factor = factor
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency):
+        with self._lock:
+            self._samples.append(latency)
+
+    def current(self):
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.maximum
+            lat = sorted(self._samples)
+        p = lat[min(len(lat) - 1, int(len(lat) * self.percentile))]
+        return max(self.minimum, min(self.maximum, p * self.factor))
+
+class RetryPolicy:
+    """Up to `attempts` tries with full-jitter exponential backoff between them."""
+    def __init__(self, attempts=3, base_delay=0.1, max_delay=1.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+# ---------- result model ----------
+@dataclass(slots=True)
+class Definition:
+    text: str
+    example: str = ""
+
+@dataclass(slots=True)
+class Meaning:
+    part_of_speech: str  # interned: the same few strings repeat across every result
+    definitions: list
+
+@dataclass(slots=True)
+class Entry:
+    word: object  # None when the API entry has no "word" key
+    phonetics: list
+    meanings: list
+
+@dataclass(slots=True)
+class LookupResult:
+    """
+    Compact, structured form of one API answer. Views (text(), summary()) are
+    rendered on first use and memoized on the instance.
+    """
+    entries: list
+    _views: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_api(cls, data):
+        """Build from decoded dictionaryapi.dev JSON; None if it holds nothing to show."""
+        entries = []
+        for raw in data:
+            entry = _parse_entry(raw, [_parse_meaning(m) for m in raw.get("meanings") or ()])
+            if entry.word is not None or entry.phonetics or entry.meanings:
+                entries.append(entry)
+        return cls(entries) if entries else None
+
+    @property
+    def word(self):
+        for e in self.entries:
+            if e.word is not None:
+                return e.word
+        return ""
+
+    def _memo(self, name, render):
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = render()
+        return view
+
+    def text(self):
+        """Plain-text view (what ResultWindow shows)."""
+        return self._memo("text", self._render_text)
+
+    def summary(self, limit=120):
+        """One line for the tray tooltip: 'word (noun): first definition'."""
+        return self._memo(f"summary:{limit}", lambda: self._render_summary(limit))
+
+    def _render_text(self):
+        # single pass: every line goes into one list with its leading newline, joined once
+        parts = []
+        add = parts.append
+        for e in self.entries:
+            _add_header_text(add, e)
+            for m in e.meanings:
+                _add_meaning_text(add, m)
+        # drop the newline in front of the first line
+        return "".join(parts)[1:]
+
+    def _render_summary(self, limit):
+        first = next((m for e in self.entries for m in e.meanings if m.definitions), None)
+        if first is None:
+            return self.word
+        line = f"{self.word} ({first.part_of_speech}): {first.definitions[0].text}"
+        return line if len(line) <= limit else line[:limit - 1] + "\u2026"
+
+    def approx_size(self):
+        """Rough bytes held, including the views rendered so far (for cache budgeting)."""
+        size = 64 + sum(sys.getsizeof(view) for view in self._views.values())
+        for e in self.entries:
+            size += 64 + len(e.word or "") + sum(len(p) + 40 for p in e.phonetics)
+            for m in e.meanings:
+                size += 64
+                for d in m.definitions:
+                    size += 2 * (len(d.text) + len(d.example)) + 120
+        return size
+
+@dataclass(slots=True)
+class BatchResult:
+    """
+    Results of a multi-word selection, in selection order: (word, LookupResult, or None
+    if there is no such word, or an error message) per word.
+    """
+    items: list
+
+    def approx_size(self):
+        return 64 + sum(
+            64 + len(word) + (r.approx_size() if isinstance(r, LookupResult) else len(r or ""))
+            for word, r in self.items
+        )
+
+def _parse_meaning(raw):
+    return Meaning(
+        sys.intern(str(raw.get("partOfSpeech",""))),
+        [Definition(str(d.get("definition","")), str(d.get("example","") or ""))
+         for d in raw.get("definitions", [])],
+    )
+
+def _parse_entry(raw, meanings):
+    phonetics = [p.get("text","") for p in raw.get("phonetics") or () if p.get("text")]
+    word = str(raw.get("word")) if "word" in raw else None
+    return Entry(word, phonetics, meanings)
+
+def _add_header_text(add, e):
+    if e.word is not None:
+        add(f"\nWord: {e.word}")
+    if e.phonetics:
+        add(f"\nPronunciation: {', '.join(e.phonetics)}")
+
+def _add_meaning_text(add, m):
+    add(f"\n\nPart of speech: {m.part_of_speech}")
+    for i, d in enumerate(m.definitions, start=1):
+        if d.example:
+            add(f"\n  {i}. {d.text}\n     e.g., {d.example}")
+        else:
+            add(f"\n  {i}. {d.text}")
+
+def parse_event(kind, raw):
+    """
+    Model piece for an EntryStreamParser event: ("entry", Entry) for a header (its
+    meanings follow as pieces of their own) or ("meaning", Meaning).
+    """
+    if kind == "header":
+        return ("entry", _parse_entry(raw, []))
+    return ("meaning", _parse_meaning(raw))
+
+def format_entries(data):
+    """Turn decoded API JSON into the plain-text result shown to the user (None if empty)."""
+    result = LookupResult.from_api(data)
+    return result.text() if result is not None else None
+
+# ---------- lookup cache ----------
+def normalize_key(text):
+    """Cache/lookup key for a selection: trimmed, lower-cased, inner whitespace collapsed."""
+    return " ".join(str(text).split()).lower()
+
+CACHE_MISS = object()
+
+# ---------- multi-word selections ----------
+STOPWORDS = frozenset("""
+a about above after again against all am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further
+had has have having he her here hers herself him himself his how i if in into is it its itself
+just me more most my myself no nor not now of off on once only or other our ours ourselves out
+over own same she should so some such than that the their theirs them themselves then there
+these they this those through to too under until up very was we were what when where which
+while who whom why will with would you your yours yourself yourselves
+""".split())
+
+_WORD_RE = re.compile(r"[^\W\d_]+(?:['\u2019-][^\W\d_]+)*")
+
+def selection_words(selection, max_words=BATCH_MAX_WORDS):
+    """
+    Words of `selection` worth looking up, in order of first appearance: lower-cased,
+    possessive 's dropped, without stopwords, single letters or repeats.
+    """
+    words = []
+    seen = set()
+    for match in _WORD_RE.finditer(str(selection)):
+        word = match.group().lower()
+        if word.endswith(("'s", "\u2019s")):
+            word = word[:-2]
+        if len(word) < 2 or word in STOPWORDS or word in seen:
+            continue
+        seen.add(word)
+        words.append(word)
+        if len(words) >= max_words:
+            break
+    return words
+
+def lookup_plan(selection):
+    """
+    What to look up for `selection`: [selection] itself for a single word (or when nothing
+    but stopwords is selected), otherwise the words from selection_words().
+    """
+    if len(str(selection).split()) < 2:
+        return [selection]
+    return selection_words(selection) or [selection]
+
+class LookupCache:
+    """
+    Thread-safe, byte-bounded LRU cache of lookup results (LookupResult models).
+    Found words and "not found" (None) outcomes are both cached, each with its own TTL.
+    hits / misses / evictions counters are kept for sizing; see stats().
+    """
+    ENTRY_OVERHEAD = 96  # rough per-entry cost of the OrderedDict slot + tuple
+
+    def __init__(self, max_bytes=4 * 1024 * 1024, ttl=6 * 3600, negative_ttl=15 * 60):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._data = OrderedDict()  # key -> (expires_at, size, value)
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def _entry_size(cls, key, value):
+        approx_size = getattr(value, "approx_size", None)
+        value_size = approx_size() if approx_size is not None else sys.getsizeof(value)
+        return sys.getsizeof(key) + value_size + cls.ENTRY_OVERHEAD
+
+    def get(self, key, default=CACHE_MISS):
+        """Return the cached value for `key` (may be None for a cached 404), or `default`."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            expires_at, size, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.current_bytes -= size
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key, default=CACHE_MISS):
+        """Like get(), but leaves the hit/miss counters and the LRU order alone."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] < time.monotonic():
+                return default
+            return item[2]
+
+    def put(self, key, value):
+        ttl = self.negative_ttl if value is None else self.ttl
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._data[key] = (time.monotonic() + ttl, size, value)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes and self._data:
+                _, (_, old_size, _) = self._data.popitem(last=False)
+                self.current_bytes -= old_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+class DiskCache:
+    """
+    Persistent cache of raw API JSON per word, stored in SQLite (WAL mode).
+    Survives restarts so previously seen words resolve without the network.
+    The database is kept under `max_bytes` by evicting least-recently-used rows
+    (fewest hits first on ties) from a background compaction thread.
+    """
+    def __init__(self, path=None, max_bytes=DISK_CACHE_MAX_BYTES, max_age=DISK_CACHE_MAX_AGE,
+                 compact_interval=600):
+        self.path = path or os.path.join(user_cache_dir(), "lookups.sqlite3")
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compact_interval = compact_interval
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access, hits)")
+        # running SUM(size), kept by put/get/compact so inserts need not scan the table
+        self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        self._wake = threading.Event()
+        self._closed = False
+        self._compactor = threading.Thread(target=self._compact_loop, daemon=True)
+        self._compactor.start()
+
+    def get(self, key):
+        """Return the decoded API JSON stored for `key`, or None."""
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return None
+            row = self._conn.execute(
+                "SELECT payload, fetched_at, size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.max_age:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.total_bytes -= row[2]
+                return None
+            self._conn.execute(
+                "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+        try:
+            return json_loads(row[0])
+        except Exception:
+            return None
+
+    def put(self, key, data):
+        payload = json_dumps(data)
+        size = len(payload.encode("utf-8")) + len(key)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                return
+            old = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, payload, size, fetched_at, last_access, hits)"
+                " VALUES (?, ?, ?, ?, ?, 0)",
+                (key, payload, size, now, now),
+            )
+            self.total_bytes += size - (old[0] if old is not None else 0)
+            total = self.total_bytes
+        if total > self.max_bytes:
+            self._wake.set()
+
+    def compact(self):
+        """Evict expired and least-recently-used rows until under the size cap, then reclaim space."""
+        with self._lock:
+            if self._closed:
+                return
+            self._conn.execute("DELETE FROM entries WHERE fetched_at < ?", (time.time() - self.max_age,))
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                # trim to 90% of the cap so we don't compact again on the very next insert
+                excess = total - int(self.max_bytes * 0.9)
+                victims = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM entries ORDER BY last_access ASC, hits ASC"
+                ):
+                    victims.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+            # compaction scans the table anyway: resync the running total with it
+            self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            self._conn.execute("PRAGMA incremental_vacuum")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _compact_loop(self):
+        while not self._closed:
+            self._wake.wait(self.compact_interval)
+            self._wake.clear()
+            try:
+                self.compact()
+            except Exception:
+                pass
+
+    def items(self):
+        """Return every (key, api_json) pair currently stored."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, payload FROM entries").fetchall()
+        return [(key, json_loads(payload)) for key, payload in rows]
+
+    def stats(self):
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            total = self.total_bytes
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._wake.set()
+
+def open_disk_cache(**kwargs):
+    """Open the on-disk cache, or return None if it cannot be used (read-only home, etc.)."""
+    try:
+        return DiskCache(**kwargs)
+    except Exception:
+        return None
+
+# ---------- offline dictionary ----------
+# Index file layout (all little-endian):
+#   header  : magic "WPIDX1\0\0", u32 count, u32 reserved, u64 keys_offset, u64 defs_offset
+#   records : count x (u64 key_off, u32 key_len, u64 def_off, u32 def_len), sorted by key bytes
+#   keys    : utf-8 normalized words, back to back
+#   defs    : compact raw API JSON per word, back to back
+OFFLINE_MAGIC = b"WPIDX1\0\0"
+_OFFLINE_HEADER = struct.Struct("<8sIIQQ")
+_OFFLINE_RECORD = struct.Struct("<QIQI")
+
+def build_offline_index(items, path):
+    """
+    Write an offline index to `path` from (word, api_json) pairs.
+    Later duplicates of a word replace earlier ones. Returns the number of words written.
+    """
+    by_key = {}
+    for word, data in items:
+        key = normalize_key(word)
+        if key and data:
+            by_key[key.encode("utf-8")] = json_dumps(data).encode("utf-8")
+    keys = sorted(by_key)
+    table_off = _OFFLINE_HEADER.size
+    keys_off = table_off + _OFFLINE_RECORD.size * len(keys)
+    keys_len = sum(len(k) for k in keys)
+    defs_off = keys_off + keys_len
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_OFFLINE_HEADER.pack(OFFLINE_MAGIC, len(keys), 0, keys_off, defs_off))
+        k_pos = d_pos = 0
+        for k in keys:
+            f.write(_OFFLINE_RECORD.pack(k_pos, len(k), d_pos, len(by_key[k])))
+            k_pos += len(k)
+            d_pos += len(by_key[k])
+        for k in keys:
+            f.write(k)
+        for k in keys:
+            f.write(by_key[k])
+    os.replace(tmp_path, path)
+    return len(keys)
+
+class OfflineDictionary:
+    """
+    Read-only dictionary backed by a memory-mapped index file (see build_offline_index).
+    Lookups binary-search the sorted record table in place, so only the pages that are
+    touched get read from disk; nothing is loaded into RAM up front.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, self.count, _, self._keys_off, self._defs_off = _OFFLINE_HEADER.unpack_from(self._mm, 0)
+            if magic != OFFLINE_MAGIC:
+                raise ValueError(f"{path} is not a WordPeek offline index")
+        except Exception:
+            self.close()
+            raise
+        self._table_off = _OFFLINE_HEADER.size
+
+    def _record(self, i):
+        return _OFFLINE_RECORD.unpack_from(self._mm, self._table_off + i * _OFFLINE_RECORD.size)
+
+    def get(self, word):
+        """Return the stored API JSON for `word`, or None if the index does not have it."""
+        target = normalize_key(word).encode("utf-8")
+        mm = self._mm
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key_off, key_len, def_off, def_len = self._record(mid)
+            start = self._keys_off + key_off
+            key = mm[start:start + key_len]
+            if key < target:
+                lo = mid + 1
+            elif key > target:
+                hi = mid
+            else:
+                start = self._defs_off + def_off
+                return json_loads(mm[start:start + def_len])
+        return None
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __len__(self):
+        return self.count
+
+    def close(self):
+        mm = getattr(self, "_mm", None)
+        if mm is not None:
+            mm.close()
+            self._mm = None
+        self._file.close()
+
+def offline_index_path():
+    """Location of the offline index: $WORDPEEK_OFFLINE_INDEX, else next to the app/bundle."""
+    return os.environ.get("WORDPEEK_OFFLINE_INDEX") or resource_path(OFFLINE_INDEX_NAME)
+
+def open_offline_dictionary(path=None):
+    """Open the offline dictionary if an index exists, else return None."""
+    path = path or offline_index_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        return OfflineDictionary(path)
+    except Exception:
+        return None
+
+# ---------- providers / hedged fetching ----------
+class Provider:
+    """
+    A source of raw dictionaryapi.dev-shaped JSON.
+    fetch() returns the entries, None when the provider does not have the word,
+    or raises DictionaryAPIError.
+    `authoritative` providers' None means "no such word"; others' None just means
+    "ask someone else". Answers from `cacheable` providers are written to the disk cache.
+    `local` providers answer in microseconds and are asked on the caller's thread.
+    """
+    name = "provider"
+    authoritative = False
+    cacheable = False
+    local = False
+
+    def fetch(self, word, on_event=None):
+        """`on_event(index, kind, raw)`, if given, receives parse events while the answer streams in."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class HttpProvider(Provider):
+    """
+    A dictionaryapi.dev-compatible HTTP API, wrapped in the resilience layer:
+    adaptive timeouts, jittered retries of 5xx/429 answers (within one timeout overall)
+    and a circuit breaker that refuses calls (CircuitOpenError) while the endpoint is
+    unhealthy. A request that gets no reply at all (timeout, refused, reset) is not
+    retried and counts as a breaker failure straight away.
+    """
+    authoritative = True
+    cacheable = True
+
+    def __init__(self, client, name=None, breaker=None, timeout=None, retry=None):
+        self.client = client
+        self.name = name or client.base_url.split("/")[2]
+        self.breaker = breaker or CircuitBreaker()
+        self.timeout = timeout or AdaptiveTimeout(maximum=client.timeout)
+        self.retry = retry or RetryPolicy()
+
+    def fetch(self, word, on_event=None):
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.name} is unavailable right now; try again shortly")
+        budget = self.timeout.current()
+        started = time.perf_counter()
+        for attempt in range(self.retry.attempts):
+            timeout = max(0.1, budget - (time.perf_counter() - started))
+            t0 = time.perf_counter()
+            try:
+                data = fetch_entries(word, self.client, timeout=timeout, on_event=on_event)
+            except DictionaryAPIError as e:
+                if not e.transient:
+                    # the endpoint answered; a malformed/unexpected reply is not an outage
+                    self.breaker.record_success()
+                    raise
+                if e.status is None:
+                    # no reply: retrying would stall the user for another full timeout.
+                    # Let slow answers widen future timeouts and tell the breaker now.
+                    self.timeout.record(max(time.perf_counter() - t0, timeout))
+                    self.breaker.record_failure()
+                    raise
+                # 5xx/429: the server is up, retry while the lookup stays within one timeout
+                if (attempt + 1 < self.retry.attempts
+                        and self.breaker.state != CircuitBreaker.HALF_OPEN
+                        and time.perf_counter() - started < budget):
+                    time.sleep(self.retry.delay(attempt))
+                    continue
+                self.breaker.record_failure()
+                raise
+            self.timeout.record(time.perf_counter() - t0)
+            self.breaker.record_success()
+            return data
+
+    def close(self):
+        self.client.close()
+
+class OfflineProvider(Provider):
+    name = "offline"
+    local = True
+
+    def __init__(self, offline):
+        self.offline = offline
+
+    def fetch(self, word, on_event=None):
+        return self.offline.get(word)
+
+    def close(self):
+        self.offline.close()
+
+class ProviderStats:
+    """Calls, wins, errors and recent latencies (seconds) for one provider."""
+    def __init__(self, window=200):
+        self.calls = 0
+        self.wins = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=window)
+
+    def summary(self):
+        lat = sorted(self.latencies)
+        p50 = lat[len(lat) // 2] if lat else None
+        return {
+            "calls": self.calls,
+            "wins": self.wins,
+            "errors": self.errors,
+            "win_rate": self.wins / self.calls if self.calls else 0.0,
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+        }
+
+class HedgedFetcher:
+    """
+    Queries providers in order, hedging: the first one starts immediately, and each
+    further one starts when the previous ones have missed/failed or after `hedge_delay`
+    seconds without an answer (0 = all at once). The first valid answer wins and the
+    losers are cancelled (or, if already running, their answers are discarded).
+    Local providers, and a last remaining provider with nothing to hedge against, run on
+    the caller's thread; only hedged calls use the pool, sized so `max_concurrency`
+    lookups can each have every provider running.
+    """
+    def __init__(self, providers, hedge_delay=HEDGE_DELAY, max_concurrency=LOOKUP_CONCURRENCY):
+        self.providers = list(providers)
+        self.hedge_delay = hedge_delay
+        self.stats = {p.name: ProviderStats() for p in self.providers}
+        self._stats_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, max_concurrency * len(self.providers)), thread_name_prefix="wordpeek-provider")
+
+    def _call(self, provider, word, on_event):
+        t0 = time.perf_counter()
+        try:
+            return provider.fetch(word, on_event=on_event)
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._stats_lock:
+                st = self.stats[provider.name]
+                st.calls += 1
+                st.latencies.append(elapsed)
+
+    def _settle(self, provider, call):
+        """Run `call` for `provider`'s answer: (True, data) if it wins, (False, error or None) if not."""
+        try:
+            data = call()
+        except Exception as e:
+            with self._stats_lock:
+                self.stats[provider.name].errors += 1
+            return False, e
+        if data is not None or provider.authoritative:
+            with self._stats_lock:
+                self.stats[provider.name].wins += 1
+            return True, data
+        return False, None
+
+    def fetch(self, word, on_event=None):
+        """
+        Return (api_json_or_None, winning_provider_or_None).
+        `on_event(provider_name, index, kind, raw)` receives the parse events of streamed answers.
+        """
+        pending = {}
+        waiting = list(self.providers)
+        last_error = None
+
+        def events(provider):
+            if on_event is None:
+                return None
+            return lambda index, kind, raw, name=provider.name: on_event(name, index, kind, raw)
+
+        def launch():
+            provider = waiting.pop(0)
+            pending[self._executor.submit(self._call, provider, word, events(provider))] = provider
+
+        # nothing to hedge yet: ask on this thread instead of blocking it on a pool worker
+        while waiting and (waiting[0].local or len(waiting) == 1):
+            provider = waiting.pop(0)
+            won, value = self._settle(provider, lambda: self._call(provider, word, events(provider)))
+            if won:
+                return value, provider
+            last_error = value or last_error
+
+        try:
+            while pending or waiting:
+                if not pending:
+                    launch()
+                    continue
+                timeout = self.hedge_delay if waiting else None
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    launch()  # primary is slow: hedge with the next provider
+                    continue
+                for fut in done:
+                    provider = pending.pop(fut)
+                    won, value = self._settle(provider, fut.result)
+                    if won:
+                        return value, provider
+                    last_error = value or last_error
+        finally:
+            for fut in pending:
+                fut.cancel()
+        if last_error is not None:
+            if isinstance(last_error, DictionaryAPIError):
+                raise last_error
+            raise DictionaryAPIError(f"Error contacting dictionary API: {last_error}")
+        return None, None
+
+    def provider_stats(self):
+        with self._stats_lock:
+            return {name: st.summary() for name, st in self.stats.items()}
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        for p in self.providers:
+            p.close()
+
+def default_providers(client=None, offline=None, on_breaker_change=None):
+    """
+    Offline index (if any), the primary API, then any configured fallback APIs.
+    `on_breaker_change(provider_name, state)` is called when an API's circuit breaker flips.
+    """
+    providers = []
+    if offline is not None:
+        providers.append(OfflineProvider(offline))
+    clients = [client or default_client()] + [LookupClient(base_url=url) for url in FALLBACK_APIS]
+    for c in clients:
+        provider = HttpProvider(c)
+        if on_breaker_change is not None:
+            provider.breaker.on_state_change = (
+                lambda state, name=provider.name: on_breaker_change(name, state))
+        providers.append(provider)
+    return providers
+
+class ProgressRelay:
+    """
+    Fans the parsed pieces (see parse_event) of one in-flight lookup out to its subscribers,
+    as lists of pieces. Fed the parse events of whichever provider streams first (the others
+    are ignored); a retry re-sends events from index 0, and those already relayed are skipped.
+    A late subscriber first gets everything relayed so far in one list.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._source = None
+        self._next = 0
+        self._pieces = []
+        self._listeners = []
+
+    def subscribe(self, listener):
+        with self._lock:
+            if self._pieces:
+                listener(list(self._pieces))
+            self._listeners.append(listener)
+
+    def emit(self, source, index, kind, raw):
+        with self._lock:
+            if self._source is None:
+                self._source = source
+            if source != self._source or index != self._next:
+                return
+            self._next += 1
+            try:
+                piece = parse_event(kind, raw)
+            except Exception:
+                return  # best effort: the final result replaces whatever was shown
+            self._pieces.append(piece)
+            for listener in self._listeners:
+                listener([piece])
+
+class LookupService:
+    """
+    What the app calls to look a selection up: in-memory result cache, then the
+    on-disk cache of raw API JSON, then the providers (offline dictionary and APIs,
+    hedged by a HedgedFetcher).
+    Errors are returned as message strings, but never cached.
+    Concurrent lookups of the same key share one outstanding fetch (single-flight).
+    With `progressive` set, API answers are streamed and lookup(on_progress=...) gets
+    the parsed entries and meanings while the rest is still arriving.
+    """
+    def __init__(self, client=None, cache=None, disk_cache=None, offline=None, providers=None,
+                 hedge_delay=HEDGE_DELAY, progressive=False, max_concurrency=LOOKUP_CONCURRENCY):
+        self.client = client or default_client()
+        self.cache = cache if cache is not None else LookupCache()
+        self.disk_cache = disk_cache
+        if providers is None:
+            providers = default_providers(self.client, offline)
+        self.fetcher = HedgedFetcher(providers, hedge_delay, max_concurrency)
+        self.progressive = progressive
+        self._inflight = {}  # key -> (Future, ProgressRelay or None) of the fetch running for it
+        self._inflight_lock = threading.Lock()
+        self.coalesced = 0
+        self.prefetches = 0
+
+    def lookup(self, selection, on_progress=None):
+        """
+        Result for `selection`. `on_progress(pieces)`, if given, is called with lists of parsed
+        pieces (see parse_event) while a progressive fetch streams in (never for cached results).
+        """
+        key = normalize_key(selection)
+        result = self.cache.get(key)
+        if result is not CACHE_MISS:
+            return result
+
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = (Future(), ProgressRelay() if self.progressive else None)
+                self._inflight[key] = flight
+            else:
+                self.coalesced += 1
+        fut, relay = flight
+        if on_progress is not None and relay is not None:
+            relay.subscribe(on_progress)
+        if not owner:
+            return fut.result()
+
+        try:
+            result = self._resolve(key, relay)
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(result)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return result
+
+    def cached(self, selection):
+        """Return the cached result for `selection`, or CACHE_MISS (never touches disk or network)."""
+        return self.cache.peek(normalize_key(selection))
+
+    def prefetch(self, selection):
+        """Run a lookup only to warm the cache; callers of lookup() join it while it is in flight."""
+        self.prefetches += 1
+        try:
+            self.lookup(selection)
+        except Exception:
+            pass
+
+    def _resolve(self, key, relay=None):
+        """Fetch + parse `key` and fill the result cache; errors come back as message strings."""
+        try:
+            data = self._fetch(key, relay)
+        except DictionaryAPIError as e:
+            return str(e)
+        try:
+            result = LookupResult.from_api(data) if data is not None else None
+        except Exception as e:
+            return f"Error parsing API response: {e}"
+        self.cache.put(key, result)
+        return result
+
+    def _fetch(self, key, relay=None):
+        """
+        Raw API JSON for `key`: disk cache, then the providers
+        (an answer from an online provider fills the disk cache).
+        """
+        if self.disk_cache is not None:
+            data = self.disk_cache.get(key)
+            if data is not None:
+                return data
+        data, provider = self.fetcher.fetch(key, relay.emit if relay is not None else None)
+        if data is not None and provider.cacheable and self.disk_cache is not None:
+            try:
+                self.disk_cache.put(key, data)
+            except Exception:
+                pass
+        return data
+
+    def close(self):
+        self.fetcher.close()
+        self.client.close()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+
+# ---------- lookup engine ----------
+class LookupEngine:
+    """
+    Runs every lookup on one background asyncio event loop instead of a thread per lookup.
+    At most `max_concurrency` lookups run at once; the blocking LookupService calls
+    (pooled requests session, SQLite, mmap) execute on a fixed executor of the same size.
+    submit() and prefetch() are safe to call from any thread.
+    """
+    def __init__(self, service, max_concurrency=LOOKUP_CONCURRENCY):
+        self.service = service
+        self.max_concurrency = max_concurrency
+        self.loop = None  # started on first use, keeping asyncio off the startup path
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="wordpeek-lookup")
+                self.loop.set_default_executor(self._executor)
+                self._sem = asyncio.Semaphore(self.max_concurrency)
+                self._thread = threading.Thread(target=self._run, name="wordpeek-engine", daemon=True)
+                self._thread.start()
+        return self.loop
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, selection, callback=None, on_progress=None):
+        """
+        Schedule a lookup of `selection`. `callback(selection, result)` runs on an engine
+        thread when it completes (errors arrive as "__ERROR__:<message>"); `on_progress`
+        is passed to LookupService.lookup().
+        Returns a concurrent.futures.Future of the result.
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._lookup(selection, callback, on_progress), loop)
+
+    def submit_batch(self, words, callback=None, max_concurrency=BATCH_CONCURRENCY):
+        """
+        Look up several words, at most `max_concurrency` of them at a time (on top of the
+        engine-wide limit, so one batch leaves room for other lookups).
+        `callback(words, results)` runs on an engine thread with the results in the order
+        of `words` (errors as "__ERROR__:<message>"). Returns a Future of the results.
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(
+            self._lookup_batch(list(words), callback, max_concurrency), loop)
+
+    async def _lookup_batch(self, words, callback, max_concurrency):
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def one(word):
+            async with sem:
+                try:
+                    return await self._run_blocking(self.service.lookup, word)
+                except Exception as e:
+                    return f"__ERROR__:{e}"
+
+        results = await asyncio.gather(*(one(word) for word in words))
+        if callback is not None:
+            callback(words, results)
+        return results
+
+    def prefetch(self, selection):
+        """Schedule a cache-warming lookup (see LookupService.prefetch)."""
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._run_blocking(self.service.prefetch, selection), loop)
+
+    async def _run_blocking(self, fn, *args):
+        async with self._sem:
+            return await self.loop.run_in_executor(None, fn, *args)
+
+    async def _lookup(self, selection, callback, on_progress):
+        try:
+            result = await self._run_blocking(self.service.lookup, selection, on_progress)
+        except Exception as e:
+            result = f"__ERROR__:{e}"
+        if callback is not None:
+            callback(selection, result)
+        return result
+
+    def close(self):
+        with self._start_lock:
+            if self.loop is None:
+                return
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self._executor.shutdown(wait=False)
+
+# ---------- selection capture ----------
+def send_copy_keystroke():
+    """Send the platform copy shortcut to the focused window."""
+    try:
+        try:
+            pyautogui.hotkey(COPY_MODIFIER, "c")
+        except Exception:
+            pyautogui.keyDown(COPY_MODIFIER)
+            pyautogui.press("c")
+            pyautogui.keyUp(COPY_MODIFIER)
+    except Exception:
+        pass
+
+def capture_selection(send_copy, read_text, sequence=None, deadline=0.5, first_poll=0.002, max_poll=0.025):
+    """
+    Copy the current selection and return (text, seconds_taken).
+    The clipboard is only read, never cleared or restored, so whatever it held (images,
+    files, rich text) is left to the copy. The copy is seen as `sequence()` - a counter the
+    clipboard backend bumps on every change, None if it has none - moving on, or as the
+    text changing; the clipboard is polled with a short exponential backoff and returned
+    as soon as that happens. If nothing arrives within `deadline` seconds the current
+    text is returned (the user may have copied manually before pressing the hotkey).
+    """
+    def current_sequence():
+        try:
+            return sequence() if sequence is not None else None
+        except Exception:
+            return None
+
+    t0 = time.perf_counter()
+    start_sequence = current_sequence()
+    try:
+        previous = read_text() or ""
+    except Exception:
+        previous = ""
+
+    send_copy()
+
+    end = t0 + deadline
+    delay = first_poll
+    while True:
+        try:
+            text = read_text() or ""
+        except Exception:
+            text = ""
+        changed = start_sequence is not None and current_sequence() != start_sequence
+        if text and (changed or text != previous):
+            return text, time.perf_counter() - t0
+        now = time.perf_counter()
+        if now >= end:
+            break
+        time.sleep(min(delay, end - now))
+        delay = min(delay * 2, max_poll)
+    return previous, time.perf_counter() - t0
+
+def read_primary_selection():
+    """
+    Highlighted text from the X11/Wayland PRIMARY selection, read in-process.
+    Must run on the GUI thread. Returns "" when there is none or the platform has no PRIMARY.
+    """
+    clipboard = QtWidgets.QApplication.clipboard()
+    if clipboard is None or not clipboard.supportsSelection():
+        return ""
+    return clipboard.text(QtGui.QClipboard.Selection) or ""
+
+# ---------- GUI thread helpers ----------
+class GuiInvoker(QtCore.QObject):
+    """
+    Runs callables on the GUI thread on behalf of worker threads.
+    Create it on the GUI thread; call() waits for the result, post() does not.
+    """
+    _invoke = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self._invoke.connect(self._run)
+
+    def _run(self, job):
+        job()
+
+    def post(self, fn):
+        """Queue `fn()` to run on the GUI thread and return immediately."""
+        self._invoke.emit(fn)
+
+    def call(self, fn, timeout=0.5):
+        """Run `fn()` on the GUI thread and return its result (raises TimeoutError if it is busy)."""
+        if QtCore.QThread.currentThread() == self.thread():
+            return fn()
+        done = threading.Event()
+        box = {}
+
+        def job():
+            try:
+                box["value"] = fn()
+            except Exception as e:
+                box["error"] = e
+            finally:
+                done.set()
+
+        self._invoke.emit(job)
+        if not done.wait(timeout):
+            raise TimeoutError("GUI thread did not respond in time")
+        if "error" in box:
+            raise box["error"]
+        return box.get("value")
+
+# ---------- hotkey dispatch ----------
+class HotkeyDispatcher:
+    """
+    Runs `handler` for hotkey presses on one capture worker thread fed by a bounded queue,
+    instead of a new thread per press. A press that arrives while a capture is running is
+    coalesced into it (it would read the same selection); a press that finds the queue
+    full is dropped. Counters are available from stats().
+    """
+    def __init__(self, handler, max_pending=2):
+        self.handler = handler
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._capturing = False
+        self.presses = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="wordpeek-capture", daemon=True)
+        self._thread.start()
+
+    def press(self):
+        """Hotkey callback; cheap and safe to call from any thread."""
+        with self._lock:
+            self.presses += 1
+            if self._capturing:
+                self.coalesced += 1
+                return
+            try:
+                self._queue.put_nowait(time.perf_counter())
+            except queue.Full:
+                self.dropped += 1
+
+    def _run(self):
+        while True:
+            self._queue.get()
+            with self._lock:
+                self._capturing = True
+            try:
+                self.handler()
+            except Exception:
+                pass
+            finally:
+                with self._lock:
+                    self._capturing = False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "presses": self.presses,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "queue_depth": self._queue.qsize(),
+            }
+
+def parse_chord(chord):
+    """"ctrl+shift+d" -> ({"ctrl", "shift"}, "d")."""
+    parts = [p.strip().lower() for p in chord.split("+") if p.strip()]
+    return set(parts[:-1]), parts[-1]
+
+class KeyboardHotkeyBackend:
+    """
+    The `keyboard` package: works everywhere it has permissions, but installs a
+    system-wide hook that runs Python for every key typed. Kept as the fallback.
+    """
+    name = "keyboard"
+
+    def start(self, chord, callback):
+        import keyboard  # may require admin or accessibility permissions
+        self._keyboard = keyboard
+        self._handle = keyboard.add_hotkey(chord, callback)
+        # DO NOT call keyboard.wait() here because Qt's event loop keeps the process alive
+
+    def stop(self):
+        try:
+            self._keyboard.remove_hotkey(self._handle)
+        except Exception:
+            pass
+
+class NativeHotkeyBackend:
+    """
+    Base for backends that register only the chord with the OS and wait for it on
+    their own thread, so ordinary typing never reaches Python.
+    Subclasses implement _serve(chord, callback, ready) and _wake().
+    """
+    name = "native"
+
+    def start(self, chord, callback, timeout=2.0):
+        self._stopping = False
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._serve_safely, args=(chord, callback), name=f"wordpeek-hotkey-{self.name}", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise RuntimeError(f"{self.name} hotkey registration timed out")
+        if self._error is not None:
+            raise self._error
+
+    def _serve_safely(self, chord, callback):
+        try:
+            self._serve(chord, callback)
+        except Exception as e:
+            self._error = e
+        finally:
+            self._ready.set()
+
+    def stop(self):
+        self._stopping = True
+        try:
+            self._wake()
+        except Exception:
+            pass
+
+class X11HotkeyBackend(NativeHotkeyBackend):
+    """XGrabKey on the root window through Xlib (ctypes); events are read on a private connection."""
+    name = "x11"
+    MASKS = {"shift": 1 << 0, "ctrl": 1 << 2, "control": 1 << 2, "alt": 1 << 3,
+             "super": 1 << 6, "win": 1 << 6, "command": 1 << 6}
+    LOCK_MASKS = (0, 1 << 1, 1 << 4, (1 << 1) | (1 << 4))  # CapsLock, NumLock combinations
+    KEY_PRESS = 2
+    _ERROR_HANDLER_TYPE = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
+
+    def _serve(self, chord, callback):
+        path = ctypes.util.find_library("X11")
+        if not path or not os.environ.get("DISPLAY"):
+            raise RuntimeError("X11 is not available")
+        xlib = ctypes.CDLL(path)
+        xlib.XOpenDisplay.restype = ctypes.c_void_p
+        xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+        xlib.XDefaultRootWindow.argtypes = [ctypes.c_void_p]
+        xlib.XStringToKeysym.restype = ctypes.c_ulong
+        xlib.XStringToKeysym.argtypes = [ctypes.c_char_p]
+        xlib.XKeysymToKeycode.restype = ctypes.c_ubyte
+        xlib.XKeysymToKeycode.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        xlib.XGrabKey.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_uint, ctypes.c_ulong,
+                                  ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        xlib.XSync.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        xlib.XSetErrorHandler.restype = ctypes.c_void_p
+        xlib.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+        xlib.XPending.argtypes = [ctypes.c_void_p]
+        xlib.XNextEvent.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        xlib.XConnectionNumber.argtypes = [ctypes.c_void_p]
+        xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+
+        mods, key = parse_chord(chord)
+        mask = 0
+        for m in mods:
+            if m not in self.MASKS:
+                raise ValueError(f"unsupported modifier for X11: {m}")
+            mask |= self.MASKS[m]
+
+        display = xlib.XOpenDisplay(None)
+        if not display:
+            raise RuntimeError("cannot open X display")
+        try:
+            root = xlib.XDefaultRootWindow(display)
+            keycode = xlib.XKeysymToKeycode(display, xlib.XStringToKeysym(key.encode("ascii")))
+            if not keycode:
+                raise ValueError(f"unknown key: {key}")
+            # The Xlib error handler is process-wide: catch BadAccess from the grabs only,
+            # then put the previous handler back while our callback is still alive
+            grab_failed = []
+            handler = self._ERROR_HANDLER_TYPE(lambda d, e: grab_failed.append(True) or 0)
+            previous = xlib.XSetErrorHandler(handler)
+            try:
+                for lock in self.LOCK_MASKS:
+                    # owner_events=True, GrabModeAsync=1 for pointer and keyboard
+                    xlib.XGrabKey(display, keycode, mask | lock, root, 1, 1, 1)
+                xlib.XSync(display, 0)
+            finally:
+                xlib.XSetErrorHandler(previous)
+            if grab_failed:
+                raise RuntimeError(f"{chord} is already grabbed by another application")
+            self._ready.set()
+
+            fd = xlib.XConnectionNumber(display)
+            event = ctypes.create_string_buffer(192)  # sizeof(XEvent)
+            while not self._stopping:
+                if not xlib.XPending(display):
+                    select.select([fd], [], [], 0.5)
+                    continue
+                xlib.XNextEvent(display, event)
+                if ctypes.c_int.from_buffer(event).value == self.KEY_PRESS:
+                    callback()
+        finally:
+            xlib.XCloseDisplay(display)
+
+    def _wake(self):
+        pass  # the select() timeout notices _stopping
+
+class WindowsHotkeyBackend(NativeHotkeyBackend):
+    """RegisterHotKey + a GetMessage loop on the registering thread."""
+    name = "windows"
+    MODS = {"alt": 0x0001, "ctrl": 0x0002, "control": 0x0002, "shift": 0x0004, "win": 0x0008}
+    MOD_NOREPEAT = 0x4000
+    WM_HOTKEY = 0x0312
+    WM_QUIT = 0x0012
+    HOTKEY_ID = 1
+
+    def _serve(self, chord, callback):
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+        mods, key = parse_chord(chord)
+        flags = self.MOD_NOREPEAT
+        for m in mods:
+            if m not in self.MODS:
+                raise ValueError(f"unsupported modifier for Windows: {m}")
+            flags |= self.MODS[m]
+        if len(key) != 1:
+            raise ValueError(f"unsupported key: {key}")
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        if not user32.RegisterHotKey(None, self.HOTKEY_ID, flags, ord(key.upper())):
+            raise ctypes.WinError()
+        self._ready.set()
+        try:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == self.WM_HOTKEY and msg.wParam == self.HOTKEY_ID:
+                    callback()
+        finally:
+            user32.UnregisterHotKey(None, self.HOTKEY_ID)
+
+    def _wake(self):
+        ctypes.windll.user32.PostThreadMessageW(self._thread_id, self.WM_QUIT, 0, 0)
+
+def hotkey_backend_candidates():
+    """
+    Hotkey backends to try, best first. Set WORDPEEK_HOTKEY_BACKEND=keyboard|x11|windows
+    to force one. Wayland sessions skip X11: XWayland accepts the grab, but it only fires
+    while an XWayland window has focus.
+    """
+    backends = {"keyboard": KeyboardHotkeyBackend, "x11": X11HotkeyBackend, "windows": WindowsHotkeyBackend}
+    forced = os.environ.get("WORDPEEK_HOTKEY_BACKEND", "").strip().lower()
+    if forced in backends:
+        return [backends[forced]]
+    system = platform.system()
+    if system == "Windows":
+        return [WindowsHotkeyBackend, KeyboardHotkeyBackend]
+    wayland = (bool(os.environ.get("WAYLAND_DISPLAY"))
+               or os.environ.get("XDG_SESSION_TYPE", "").lower() == "wayland")
+    if system == "Linux" and os.environ.get("DISPLAY") and not wayland:
+        return [X11HotkeyBackend, KeyboardHotkeyBackend]
+    return [KeyboardHotkeyBackend]
+
+# ---------- clipboard backends ----------
+class PyperclipClipboard:
+    """Clipboard through pyperclip (spawns xclip/xsel per call on Linux)."""
+    name = "pyperclip"
+
+    def paste(self):
+        return pyperclip.paste()
+
+    def sequence(self):
+        """No change notifications through pyperclip: capture_selection compares text instead."""
+        return None
+
+class QtClipboard:
+    """
+    Clipboard through the application's own QClipboard, marshalled to the GUI thread,
+    so reads cost no subprocess. Falls back to pyperclip if the GUI thread is busy or Qt fails.
+    """
+    name = "qt"
+
+    def __init__(self, gui, fallback=None):
+        """Create on the GUI thread: it counts QClipboard.dataChanged for sequence()."""
+        self.gui = gui
+        self.fallback = fallback or PyperclipClipboard()
+        self._changes = 0
+        QtWidgets.QApplication.clipboard().dataChanged.connect(self._on_changed)
+
+    def _on_changed(self):
+        self._changes += 1
+
+    def sequence(self):
+        return self._changes
+
+    def paste(self):
+        try:
+            return self.gui.call(lambda: QtWidgets.QApplication.clipboard().text())
+        except Exception:
+            return self.fallback.paste()
+
+# ---------- single instance ----------
+# A running WordPeek listens on a per-user local socket; later launches forward their
+# command ("show", "lookup <word>" or "quit") to it and exit without starting Qt.
+INSTANCE_COMMANDS = ("show", "lookup", "quit")
+
+def instance_server_name():
+    user = os.environ.get("USER") or os.environ.get("USERNAME") or "user"
+    return f"wordpeek-{user}"
+
+def send_to_running_instance(command, timeout_ms=250):
+    """Forward `command` to an already running instance; False if none is listening."""
+    sock = QtNetwork.QLocalSocket()
+    sock.connectToServer(instance_server_name())
+    if not sock.waitForConnected(timeout_ms):
+        return False
+    sock.write((command + "\n").encode("utf-8"))
+    sock.waitForBytesWritten(timeout_ms)
+    sock.disconnectFromServer()
+    return True
+
+class InstanceServer(QtCore.QObject):
+    """Accepts commands from later launches; emits command_received(line) on the GUI thread."""
+    command_received = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QtNetwork.QLocalServer(self)
+        self.server.setSocketOptions(QtNetwork.QLocalServer.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+
+    def listen(self):
+        """Take the per-user instance socket (replacing any socket file there; see claim_instance)."""
+        return self.server.listen(instance_server_name())
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            sock = self.server.nextPendingConnection()
+            sock.readyRead.connect(lambda sock=sock: self._on_ready_read(sock))
+            sock.disconnected.connect(sock.deleteLater)
+
+    def _on_ready_read(self, sock):
+        while sock.canReadLine():
+            line = bytes(sock.readLine()).decode("utf-8", "replace").strip()
+            if line:
+                self.command_received.emit(line)
+
+    def close(self):
+        self.server.close()
+
+def claim_instance(command, parent=None):
+    """
+    Become the running instance: returns a listening InstanceServer, or None when another
+    instance holds the socket and `command` was forwarded to it. Call this as soon as a
+    QApplication exists: an instance starting up at the same moment accepts connections
+    (and queues our command) from the moment it listens.
+    """
+    # listen() is no test for a live instance: with socket options set, Qt binds in a temp
+    # dir and renames over whatever socket file is there. So launches take turns under a
+    # lock, and a socket nobody accepts on is left over from a crash and can be replaced.
+    lock = QtCore.QLockFile(os.path.join(QtCore.QDir.tempPath(), instance_server_name() + ".lock"))
+    lock.lock()
+    try:
+        if send_to_running_instance(command, timeout_ms=1000):
+            return None
+        QtNetwork.QLocalServer.removeServer(instance_server_name())
+        server = InstanceServer(parent)
+        server.listen()
+        return server
+    finally:
+        lock.unlock()
+
+def parse_instance_command(argv):
+    """Command for the running instance from the command line (default "show")."""
+    args = [a for a in argv[1:] if not a.startswith("--")]
+    if not args or args[0] not in INSTANCE_COMMANDS:
+        return "show"
+    return " ".join(args)
 
 # ---------- Main application ----------
 class DictHelperApp(QtWidgets.QApplication):
+    MAX_PENDING_LOOKUPS = 5
+
     request_lookup = pyqtSignal(str)
-    lookup_result = pyqtSignal(str, object)  # (selection, result_text_or_None or error message)
+    lookup_result = pyqtSignal(str, object)  # (selection, LookupResult/BatchResult or None or error message)
+    api_state_changed = pyqtSignal(str, str)  # (provider name, circuit breaker state)
 
-    def __init__(self, argv):
+    def __init__(self, argv, setup=True):
         super().__init__(argv)
+        if setup:
+            self.setup()
 
+    def setup(self):
+        """
+        Everything past the bare QApplication: caches, lookup engine, tray, hotkey.
+        main() claims the single-instance socket between __init__(setup=False) and this.
+        """
         # keep the app running even when no windows are open
         self.setQuitOnLastWindowClosed(False)
 
-        self.open_windows = []
+        self.result_window = None  # one tabbed window for every result, built in _prebuild_windows
+        self.paint_times = {}  # "dialog"/"result" -> last show-to-first-paint time in ms
+        self._pending_lookups = deque()  # selections waiting for confirmation, oldest first
+        self._confirming = None  # selection shown in the confirmation dialog right now
+        self.rejected_lookups = 0
+
+        # One pooled HTTP client shared by every lookup thread, fronted by the result cache
+        self.lookup_client = LookupClient()
+        self.lookup_service = LookupService(
+            self.lookup_client,
+            disk_cache=open_disk_cache(),
+            providers=default_providers(
+                self.lookup_client,
+                offline=open_offline_dictionary(),
+                on_breaker_change=self.api_state_changed.emit,
+            ),
+            progressive=True,
+        )
+        self._api_states = {}  # provider name -> breaker state, shown in the tray tooltip
+        self._last_summary = ""  # one line on the latest result, also in the tray tooltip
+        self.lookup_engine = LookupEngine(self.lookup_service)
+        self.aboutToQuit.connect(self.lookup_engine.close)
+        self.aboutToQuit.connect(self.lookup_service.close)
+        self._loading_boxes = {}  # selection -> [loading message boxes waiting on it]
+        # selection -> result page being filled while its answer streams in
+        # (None until the first piece arrives, False once its tab has been closed)
+        self._progressive_pages = {}
+        self.last_capture_time = None  # seconds the last selection capture took
+
+        # Worker threads reach Qt objects (clipboard, message boxes) through this
+        self.gui = GuiInvoker()
+        self.use_primary_selection = self.clipboard().supportsSelection()
+        self.clipboard_backend = QtClipboard(self.gui)
 
         # Tray icon
         icon_path = resource_path("icon.png")  # bundle icon.png next to exe or use an .ico/.icns for platform
@@ -177,81 +2502,234 @@ class DictHelperApp(QtWidgets.QApplication):
         quit_action = menu.addAction("Quit")
         quit_action.triggered.connect(self.quit)
         menu.addAction("Lookup history (not implemented)")
+        stats_action = menu.addAction("Cache statistics")
+        stats_action.triggered.connect(self._show_cache_stats)
         self.tray.setContextMenu(menu)
-        self.tray.setToolTip("WordPeek - press hotkey to lookup selection")
+        self._update_tooltip()
         self.tray.show()
 
+        # Build the dialog/result windows hidden, just after the tray is up
+        self.lookup_dialog = None
+        QtCore.QTimer.singleShot(100, self._prebuild_windows)
+
         # Connect signals
         self.request_lookup.connect(self._handle_lookup_request)
         self.lookup_result.connect(self._handle_lookup_result)
+        self.api_state_changed.connect(self._handle_api_state_changed)
 
         # Register hotkey in background thread (keyboard library may need permissions)
         hk = HOTKEY_MAC if platform.system() == "Darwin" else HOTKEY_WINDOWS_LINUX
+        self.hotkey_dispatcher = HotkeyDispatcher(self._on_hotkey_press_worker)
+
+        self.hotkey_backend = None
 
         def register_hotkey():
-            try:
-                import keyboard  # may require admin or accessibility permissions
-                # register callback that starts a daemon thread to handle the hotkey action
-                keyboard.add_hotkey(hk, lambda: threading.Thread(target=self._on_hotkey_press_worker, daemon=True).start())
-                # DO NOT call keyboard.wait() here because Qt's event loop keeps the process alive
-            except Exception as e:
-                # Show error on the GUI thread
-                QtCore.QTimer.singleShot(0, lambda: QtWidgets.QMessageBox.critical(None, "Hotkey Error", f"Failed to register global hotkey ({hk}): {e}"))
+            # prefer a backend that registers only the chord with the OS; `keyboard` is the fallback
+            errors = []
+            for backend_cls in hotkey_backend_candidates():
+                backend = backend_cls()
+                try:
+                    backend.start(hk, self.hotkey_dispatcher.press)
+                except Exception as e:
+                    errors.append(f"{backend.name}: {e}")
+                    continue
+                self.hotkey_backend = backend
+                return
+            # Show error on the GUI thread
+            msg = f"Failed to register global hotkey ({hk}):\n" + "\n".join(errors)
+            self.gui.post(lambda: QtWidgets.QMessageBox.critical(None, "Hotkey Error", msg))
 
         thr = threading.Thread(target=register_hotkey, daemon=True)
         thr.start()
+        self.aboutToQuit.connect(self._stop_hotkey_backend)
+
+    def _stop_hotkey_backend(self):
+        if self.hotkey_backend is not None:
+            self.hotkey_backend.stop()
 
     def _on_hotkey_press_worker(self):
         """
-        Runs in a worker thread started by the hotkey callback.
+        Runs on the HotkeyDispatcher's capture worker thread.
         It simulates copy, reads clipboard, and asks GUI to prompt the user.
         """
-        try:
+        selection = ""
+        t0 = time.perf_counter()
+        if self.use_primary_selection:
+            # X11: highlighted text is already in PRIMARY, no keystroke injection or waiting needed
             try:
-                pyautogui.hotkey(COPY_MODIFIER, "c")
+                selection = self.gui.call(read_primary_selection)
             except Exception:
-                pyautogui.keyDown(COPY_MODIFIER)
-                pyautogui.press("c")
-                pyautogui.keyUp(COPY_MODIFIER)
-        except Exception:
-            pass
-
-        time.sleep(0.12)
-        try:
-            selection = pyperclip.paste()
-        except Exception:
-            selection = ""
+                selection = ""
+        if selection and selection.strip():
+            elapsed = time.perf_counter() - t0
+        else:
+            clip = self.clipboard_backend
+            selection, elapsed = capture_selection(send_copy_keystroke, clip.paste, clip.sequence)
+        self.last_capture_time = elapsed
 
         if not selection or not str(selection).strip():
-            QtCore.QTimer.singleShot(0, lambda: QtWidgets.QMessageBox.information(None, "No selection", "No text was selected (or nothing copied). Select text and press the hotkey again."))
+            self.gui.post(lambda: QtWidgets.QMessageBox.information(None, "No selection", "No text was selected (or nothing copied). Select text and press the hotkey again."))
             return
 
-        selection = str(selection).strip()
+        self._start_lookup(str(selection).strip())
+
+    def _start_lookup(self, selection):
+        """Ask the user to confirm `selection` (any thread); see _handle_lookup_request."""
         self.request_lookup.emit(selection)
 
+    def _prefetch(self, selection):
+        """
+        Speculatively start the lookup while the user reads the confirmation dialog.
+        "Yes" attaches to this fetch (single-flight) or hits the cache; "No" just leaves it cached.
+        A sentence goes through submit_batch as _begin_lookup will, BATCH_CONCURRENCY words at a time.
+        """
+        words = lookup_plan(selection)
+        if words == [selection]:
+            self.lookup_engine.prefetch(selection)
+        elif words:
+            self.lookup_engine.submit_batch(words)
+
+    def _handle_instance_command(self, line):
+        command, _, arg = line.partition(" ")
+        if command == "quit":
+            self.quit()
+        elif command == "lookup" and arg.strip():
+            self._start_lookup(arg.strip())
+        elif command == "show":
+            w = self.result_window
+            if w is not None and w.tabs.count():
+                w.show()
+                w.raise_()
+                w.activateWindow()
+            else:
+                self.tray.showMessage("WordPeek", "WordPeek is already running.",
+                                      QtWidgets.QSystemTrayIcon.Information, 3000)
+
+    def _prebuild_windows(self):
+        """Construct the confirmation dialog and the result window hidden, ahead of use."""
+        if self.lookup_dialog is None:
+            self.lookup_dialog = LookupDialog()
+            self.lookup_dialog.finished.connect(self._on_confirm_finished)
+            self.lookup_dialog.first_paint_callback = lambda ms: self._record_paint_time("dialog", ms)
+            prewarm_widget(self.lookup_dialog)
+        if self.result_window is None:
+            self.result_window = ResultWindow(app_ref=self)
+            self.result_window.page_removed.connect(self._on_result_page_removed)
+            self.result_window.first_paint_callback = lambda ms: self._record_paint_time("result", ms)
+            prewarm_widget(self.result_window)
+
+    def _show_result_page(self, selection, result):
+        """Open `result` in a new tab of the result window and bring the window up."""
+        self._prebuild_windows()  # no-op once the startup prebuild has run
+        w = self.result_window
+        page = w.add_result(selection, result)
+        if not w.isVisible():
+            w.show()
+        w.raise_()
+        return page
+
+    def _on_result_page_removed(self, page):
+        for selection, p in self._progressive_pages.items():
+            if p is page:
+                self._progressive_pages[selection] = False
+
     def _handle_lookup_request(self, selection):
-        dlg = LookupDialog(selection)
-        if dlg.exec_() == QtWidgets.QDialog.Accepted:
-            loading = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Information, "Looking up", f"Looking up \"{selection}\"...", QtWidgets.QMessageBox.NoButton)
-            loading.setWindowFlags(loading.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
-            loading.show()
-            QtWidgets.QApplication.processEvents()
-
-            def bg_lookup():
-                try:
-                    result = lookup_word_api(selection)
-                    self.lookup_result.emit(selection, result)
-                except Exception as e:
-                    self.lookup_result.emit(selection, f"__ERROR__:{e}")
-                finally:
-                    QtCore.QTimer.singleShot(0, loading.close)
+        """
+        Queue `selection` for confirmation. Requests are confirmed one at a time with a
+        non-modal dialog (open() + finished), so the GUI thread never blocks in a nested
+        event loop; when MAX_PENDING_LOOKUPS are already waiting new ones are refused.
+        Accepted requests are prefetched while they wait.
+        """
+        if selection == self._confirming or selection in self._pending_lookups:
+            return
+        if len(self._pending_lookups) >= self.MAX_PENDING_LOOKUPS:
+            self.rejected_lookups += 1
+            self.tray.showMessage("WordPeek", f"Too many lookups waiting; skipped \"{selection}\".",
+                                  QtWidgets.QSystemTrayIcon.Warning, 3000)
+            return
+        self._pending_lookups.append(selection)
+        self._prefetch(selection)
+        self._confirm_next()
 
-            t = threading.Thread(target=bg_lookup, daemon=True)
-            t.start()
-        else:
-            pass
+    def _confirm_next(self):
+        if self._confirming is not None or not self._pending_lookups:
+            return
+        self._prebuild_windows()  # no-op once the startup prebuild has run
+        self._confirming = self._pending_lookups.popleft()
+        self.lookup_dialog.set_selection(self._confirming)
+        self.lookup_dialog.open()
+
+    def _on_confirm_finished(self, result):
+        selection, self._confirming = self._confirming, None
+        if selection is not None and result == QtWidgets.QDialog.Accepted:
+            self._begin_lookup(selection)
+        # next pending request once this dialog has fully closed
+        QtCore.QTimer.singleShot(0, self._confirm_next)
+
+    def _begin_lookup(self, selection):
+        words = lookup_plan(selection)
+        if words != [selection]:
+            self._begin_batch_lookup(selection, words)
+            return
+
+        cached = self.lookup_service.cached(selection)
+        if cached is not CACHE_MISS:
+            # prefetch already finished: show the result without a loading box
+            self.lookup_result.emit(selection, cached)
+            return
+
+        loading = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Information, "Looking up", f"Looking up \"{selection}\"...", QtWidgets.QMessageBox.NoButton)
+        loading.setWindowFlags(loading.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
+        loading.show()
+        # closed by _handle_lookup_result on the GUI thread
+        self._loading_boxes.setdefault(selection, []).append(loading)
+
+        on_progress = None
+        if selection not in self._progressive_pages:
+            self._progressive_pages[selection] = None
+            on_progress = lambda pieces: self.gui.post(
+                lambda: self._handle_lookup_progress(selection, pieces))
+        self.lookup_engine.submit(selection, self.lookup_result.emit, on_progress)
+
+    def _begin_batch_lookup(self, selection, words):
+        """Look up the words of a multi-word selection concurrently; one combined result."""
+        def finish(words, results):
+            items = [(word, r.split(":", 1)[1] if isinstance(r, str) and r.startswith("__ERROR__:") else r)
+                     for word, r in zip(words, results)]
+            self.lookup_result.emit(selection, BatchResult(items))
+
+        cached = [self.lookup_service.cached(word) for word in words]
+        if CACHE_MISS not in cached:
+            finish(words, cached)
+            return
+
+        loading = QtWidgets.QMessageBox(QtWidgets.QMessageBox.Information, "Looking up",
+                                        f"Looking up {len(words)} words: {', '.join(words)}...",
+                                        QtWidgets.QMessageBox.NoButton)
+        loading.setWindowFlags(loading.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
+        loading.show()
+        self._loading_boxes.setdefault(selection, []).append(loading)
+
+        self.lookup_engine.submit_batch(words, finish)
+
+    def _handle_lookup_progress(self, selection, pieces):
+        """Show the first part of a streaming result right away and append the rest as it arrives."""
+        page = self._progressive_pages.get(selection, False)
+        if page is False:
+            return
+        if page is not None:
+            page.append_pieces(pieces)
+            return
+        for loading in self._loading_boxes.pop(selection, []):
+            loading.close()
+        page = self._progressive_pages[selection] = self._show_result_page(selection, None)
+        page.append_pieces(pieces)
 
     def _handle_lookup_result(self, selection, result):
+        for loading in self._loading_boxes.pop(selection, []):
+            loading.close()
+        streamed = self._progressive_pages.pop(selection, None)
+
         if isinstance(result, str) and result.startswith("__ERROR__:"):
             err = result.split(":", 1)[1]
             QtWidgets.QMessageBox.critical(None, "Lookup Error", f"Error while looking up \"{selection}\":\n{err}")
@@ -261,24 +2739,147 @@ class DictHelperApp(QtWidgets.QApplication):
             QtWidgets.QMessageBox.information(None, "Not found", f"No such word exists: \"{selection}\"")
             return
 
-        # Show result with Continue/Close-app options
-        resw = ResultWindow(f"Meaning: {selection}", result, app_ref=self)
-        resw.show()
+        if isinstance(result, LookupResult):
+            self._last_summary = result.summary()
+            self._update_tooltip()
+        if streamed is False:
+            return  # its tab was closed while it was streaming in
+        if streamed is not None:
+            # already on screen; only rebuild if what streamed in is not the final result
+            if streamed.result != result:
+                streamed.set_result(result)
+            self.result_window.enforce_limits()  # its size is known now
+            return
 
-        # keep a reference so it doesn't get garbage-collected and remove on close
-        self.open_windows.append(resw)
-        resw.destroyed.connect(lambda: self._remove_window_ref(resw))
+        # Show result with Continue/Close-app options, in a new tab of the result window
+        self._show_result_page(selection, result)
 
-    def _remove_window_ref(self, w):
-        try:
-            if w in self.open_windows:
-                self.open_windows.remove(w)
-        except Exception:
-            pass
+    def _record_paint_time(self, name, ms):
+        self.paint_times[name] = ms
+
+    def _handle_api_state_changed(self, name, state):
+        self._api_states[name] = state
+        self._update_tooltip()
+
+    def _update_tooltip(self):
+        tip = "WordPeek - press hotkey to lookup selection"
+        unhealthy = [f"{name}: {state}" for name, state in self._api_states.items()
+                     if state != CircuitBreaker.CLOSED]
+        if unhealthy:
+            tip += "\nDictionary API unavailable (" + ", ".join(unhealthy) + ")"
+        if self._last_summary:
+            tip += "\nLast: " + self._last_summary
+        self.tray.setToolTip(tip)
+
+    def _show_cache_stats(self):
+        st = self.lookup_service.cache.stats()
+        hk = self.hotkey_dispatcher.stats()
+        providers = "\n".join(
+            f"{name}: {ps['wins']}/{ps['calls']} wins, p50 {ps['p50_ms']} ms"
+            for name, ps in self.lookup_service.fetcher.provider_stats().items()
+        )
+        self.tray.showMessage(
+            "WordPeek cache",
+            f"{st['entries']} entries, {st['bytes'] // 1024} / {st['max_bytes'] // 1024} KiB\n"
+            f"hits {st['hits']}, misses {st['misses']}, evictions {st['evictions']}\n"
+            f"{providers}\n"
+            f"hotkey presses {hk['presses']}, coalesced {hk['coalesced']}, dropped {hk['dropped']}"
+            + "".join(f"\n{name} first paint {ms:.0f} ms" for name, ms in self.paint_times.items())
+            + (f"\nresult tabs {self.result_window.tabs.count()}, "
+               f"{self.result_window.memory_bytes() // 1024} KiB, evicted {self.result_window.evictions}"
+               if self.result_window is not None else "")
+            + (f"\nlast selection capture {self.last_capture_time * 1000:.0f} ms"
+               if self.last_capture_time is not None else ""),
+            QtWidgets.QSystemTrayIcon.Information,
+            5000
+        )
 
 # ---------- Entrypoint ----------
+def build_offline_index_cli(args):
+    """
+    --build-offline-index DEST [SRC]
+    SRC is a JSON-lines file with one dictionaryapi.dev payload per line; without it
+    the index is built from everything in the on-disk lookup cache.
+    """
+    if not args:
+        print("usage: wordpeek.py --build-offline-index DEST [SRC.jsonl]", file=sys.stderr)
+        return 2
+    dest = args[0]
+    if len(args) > 1:
+        def items():
+            with open(args[1], encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        data = json.loads(line)
+                        if data and "word" in data[0]:
+                            yield data[0]["word"], data
+    else:
+        disk = DiskCache()
+        try:
+            cached = disk.items()
+        finally:
+            disk.close()
+        def items():
+            return iter(cached)
+    n = build_offline_index(items(), dest)
+    print(f"Wrote {n} words to {dest}")
+    return 0
+
+def report_startup_profile(app, budget_ms):
+    """Print import times and time-to-tray-ready, then exit (non-zero if over budget)."""
+    ready_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+    print("WordPeek startup profile")
+    print(f"  {'module':<32}{'ms':>10}")
+    for name, seconds in sorted(_import_times, key=lambda x: x[1], reverse=True)[:25]:
+        print(f"  {name:<32}{seconds * 1000:>10.1f}")
+    print(f"  {'(all top-level imports)':<32}{sum(t for _, t in _import_times) * 1000:>10.1f}")
+    loaded = [m._name for m in DEFERRED_MODULES if m.loaded]
+    if loaded:
+        print(f"  deferred modules imported during startup: {', '.join(loaded)}")
+    print(f"tray ready after {ready_ms:.1f} ms (budget {budget_ms} ms)")
+    over = ready_ms > budget_ms
+    if over:
+        print("startup budget exceeded", file=sys.stderr)
+    app.exit(1 if over or loaded else 0)
+
 def main():
-    app = DictHelperApp(sys.argv)
+    if len(sys.argv) > 1 and sys.argv[1] == "--build-offline-index":
+        sys.exit(build_offline_index_cli(sys.argv[2:]))
+
+    profile = "--startup-profile" in sys.argv
+    budget_ms = STARTUP_BUDGET_MS
+    if "--startup-budget-ms" in sys.argv:
+        budget_ms = float(sys.argv[sys.argv.index("--startup-budget-ms") + 1])
+
+    command = parse_instance_command(sys.argv)
+    if not profile and send_to_running_instance(command):
+        sys.exit(0)
+    if command == "quit":
+        sys.exit(0)  # nothing running to quit
+
+    # Claim the instance socket before the slow part of startup, so a second launch racing
+    # this one forwards its command to us instead of starting another copy
+    app = DictHelperApp(sys.argv, setup=False)
+    if profile:
+        instance_server = InstanceServer(app)  # a profiling run exits at once: leave the socket alone
+    else:
+        instance_server = claim_instance(command, app)
+        if instance_server is None:
+            sys.exit(0)
+    app.setup()
+    instance_server.command_received.connect(app._handle_instance_command)
+    app.aboutToQuit.connect(instance_server.close)
+    if command.startswith("lookup "):
+        QtCore.QTimer.singleShot(0, lambda: app._handle_instance_command(command))
+
+    if profile:
+        # first event-loop iteration = tray icon shown and app responsive
+        QtCore.QTimer.singleShot(0, lambda: report_startup_profile(app, budget_ms))
+        sys.exit(app.exec_())
+
+    # Pull in requests/pyperclip/pyautogui once idle so the first hotkey press doesn't pay for them
+    QtCore.QTimer.singleShot(1500, lambda: threading.Thread(target=warm_deferred_imports, daemon=True).start())
 
     # Show a simple startup notification using the tray
     QtCore.QTimer.singleShot(500, lambda: app.tray.showMessage(